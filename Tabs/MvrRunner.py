@@ -1,8 +1,17 @@
-﻿import os
+﻿import copy
+import importlib
+import importlib.util
+import os
 import re
 import json
+import logging
+import mmap
 import sys
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Tuple, Optional
 
 import tkinter as tk
@@ -11,17 +20,47 @@ import socket
 
 # Optional, show clear error if missing dependencies at runtime
 _IMPORT_ERRORS = []
-try:
-    import fitz  # PyMuPDF
-except Exception as e:
-    _IMPORT_ERRORS.append(("PyMuPDF (fitz)", str(e)))
-    fitz = None  # type: ignore
 
-try:
-    from playwright.sync_api import sync_playwright
-except Exception as e:
-    _IMPORT_ERRORS.append(("playwright", str(e)))
-    sync_playwright = None  # type: ignore
+# Heavy optional dependencies are imported on first use (see _lazy_import); only their
+# presence is checked at load so the missing-dependency banner still lists them
+_LAZY_DEPS = (("PyMuPDF (fitz)", "fitz"), ("playwright", "playwright"), ("psutil", "psutil"))
+for _label, _module in _LAZY_DEPS:
+    if importlib.util.find_spec(_module) is None:
+        _IMPORT_ERRORS.append((_label, f"No module named '{_module}'"))
+
+_LAZY_IMPORTS: Dict[Tuple[str, Optional[str]], object] = {}
+
+
+def _lazy_import(label: str, module_name: str, attr: Optional[str] = None):
+    """Import an optional dependency on first use; None (recorded in _IMPORT_ERRORS) if it fails"""
+    key = (module_name, attr)
+    if key not in _LAZY_IMPORTS:
+        try:
+            obj = importlib.import_module(module_name)
+            if attr:
+                obj = getattr(obj, attr)
+        except Exception as e:
+            obj = None
+            if all(name != label for name, _ in _IMPORT_ERRORS):
+                _IMPORT_ERRORS.append((label, str(e)))
+        _LAZY_IMPORTS[key] = obj
+    return _LAZY_IMPORTS[key]
+
+
+def _get_fitz():
+    """PyMuPDF module, or None if unavailable"""
+    return _lazy_import("PyMuPDF (fitz)", "fitz")
+
+
+def _get_sync_playwright():
+    """playwright.sync_api.sync_playwright, or None if unavailable"""
+    return _lazy_import("playwright", "playwright.sync_api", "sync_playwright")
+
+
+def _get_psutil():
+    """psutil module (process detection), or None if unavailable"""
+    return _lazy_import("psutil", "psutil")
+
 
 try:
     from legacy_form_helpers import set_select_dropdown_value, fill_text_input
@@ -30,18 +69,38 @@ except Exception as e:
     set_select_dropdown_value = None  # type: ignore
     fill_text_input = None  # type: ignore
 
-try:
-    import psutil  # process detection
-except Exception as e:
-    _IMPORT_ERRORS.append(("psutil", str(e)))
-    psutil = None  # type: ignore
-
 try:
     from tkinterdnd2 import DND_FILES
 except Exception as e:
     _IMPORT_ERRORS.append(("tkinterdnd2", str(e)))
     DND_FILES = None  # type: ignore
 
+# Copy-paste mode auto-paste helpers (optional - the feature degrades to manual Ctrl+V)
+try:
+    from pynput.mouse import Listener as MouseListener
+    _PYNPUT_OK = True
+except Exception:
+    MouseListener = None  # type: ignore
+    _PYNPUT_OK = False
+
+try:
+    import pyautogui as _PYAUTOGUI
+except Exception:
+    _PYAUTOGUI = None  # type: ignore
+
+# Faster settings (de)serialization when available; the stdlib json module is the fallback
+try:
+    import orjson
+except Exception:
+    orjson = None  # type: ignore
+
+
+_log = logging.getLogger(__name__)
+# Set MVR_DEBUG=1 to see the settings load/save debug messages on stderr
+if os.environ.get("MVR_DEBUG") == "1":
+    _log.setLevel(logging.DEBUG)
+    if not _log.handlers:
+        _log.addHandler(logging.StreamHandler())
 
 # MVR Settings file path
 _THIS_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -83,38 +142,98 @@ _DEFAULT_MVR_SETTINGS = {
 }
 
 
-def _load_mvr_settings():
-    """Load MVR settings from file"""
+def _json_dumps(obj) -> bytes:
+    """Serialize settings as indented UTF-8 JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _write_settings_file(path, obj):
+    """Write settings in one call via a temp file and os.replace, so a crash never leaves a partial file"""
+    _SETTINGS_FILE_CACHE.pop(path, None)
+    tmp_path = path + ".tmp"
     try:
-        if os.path.isfile(_MVR_SETTINGS_PATH):
-            with open(_MVR_SETTINGS_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                settings = dict(_DEFAULT_MVR_SETTINGS)
-                settings.update(data)
-                # Ensure selectors dict exists and is merged
-                if "selectors" not in settings:
-                    settings["selectors"] = dict(_DEFAULT_MVR_SETTINGS["selectors"])
-                else:
-                    # Merge selector defaults
-                    for key, val in _DEFAULT_MVR_SETTINGS["selectors"].items():
-                        if key not in settings["selectors"]:
-                            settings["selectors"][key] = val
-                # Ensure login_selectors dict exists and is merged
-                if "login_selectors" not in settings:
-                    settings["login_selectors"] = dict(_DEFAULT_MVR_SETTINGS["login_selectors"])
-                else:
-                    # Merge login selector defaults
-                    for key, val in _DEFAULT_MVR_SETTINGS["login_selectors"].items():
-                        if key not in settings["login_selectors"]:
-                            settings["login_selectors"][key] = val
-                # Debug: verify account_id is loaded
-                if "account_id" in settings:
-                    print(f"DEBUG: Loaded account_id: '{settings['account_id']}'")
-                return settings
+        with open(tmp_path, "wb") as f:
+            f.write(_json_dumps(obj))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Parsed settings files keyed by path -> (mtime_ns, size, data); reparsed only when the file changes
+_SETTINGS_FILE_CACHE: Dict[str, Tuple[int, int, object]] = {}
+
+
+def _read_settings_json(path):
+    """Return a private copy of the JSON in path, or None if the file does not exist"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        _SETTINGS_FILE_CACHE.pop(path, None)
+        return None
+    cached = _SETTINGS_FILE_CACHE.get(path)
+    if cached is None or cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+        with open(path, "rb") as f:
+            if st.st_size:
+                # Decode straight from the mapped pages instead of a buffered text read
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = _json_loads(mm[:])
+            else:
+                data = _json_loads(f.read())
+        cached = (st.st_mtime_ns, st.st_size, data)
+        _SETTINGS_FILE_CACHE[path] = cached
+    # Callers merge defaults into (and mutate) the result, so never hand out the cached object
+    return copy.deepcopy(cached[2])
+
+
+def _merge_mvr_defaults(data):
+    """Settings with every default filled in, including the nested selector maps"""
+    return {
+        **_DEFAULT_MVR_SETTINGS,
+        **data,
+        "selectors": {**_DEFAULT_MVR_SETTINGS["selectors"], **data.get("selectors", {})},
+        "login_selectors": {**_DEFAULT_MVR_SETTINGS["login_selectors"], **data.get("login_selectors", {})},
+    }
+
+
+def _read_mvr_settings():
+    """Load MVR settings from file, or None when there is no readable settings file"""
+    try:
+        data = _read_settings_json(_MVR_SETTINGS_PATH)
+        if data is not None:
+            # Merge with defaults to ensure all keys exist
+            settings = _merge_mvr_defaults(data)
+            # Debug: verify account_id is loaded
+            if _log.isEnabledFor(logging.DEBUG):
+                _log.debug("Loaded account_id: '%s'", settings["account_id"])
+            return settings
     except Exception as e:
-        print(f"DEBUG: Error loading MVR settings: {e}")
-    return dict(_DEFAULT_MVR_SETTINGS)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Error loading MVR settings: %s", e)
+    return None
+
+
+def _load_mvr_settings():
+    """Load MVR settings from file"""
+    settings = _read_mvr_settings()
+    if settings is None:
+        # Fresh nested dicts so callers can't mutate the module defaults
+        settings = _merge_mvr_defaults({})
+    return settings
 
 
 def _save_mvr_settings(settings):
@@ -122,26 +241,15 @@ def _save_mvr_settings(settings):
     try:
         # Ensure directory exists
         os.makedirs(os.path.dirname(_MVR_SETTINGS_PATH), exist_ok=True)
-        # Debug: print what we're saving
-        account_id_to_save = settings.get("account_id", "")
-        print(f"DEBUG: Saving account_id: '{account_id_to_save}'")
+        # Debug: log what we're saving
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Saving account_id: '%s'", settings.get("account_id", ""))
         # Write settings to file
-        with open(_MVR_SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2, ensure_ascii=False)
-        # Verify the file was written by reading it back
-        try:
-            with open(_MVR_SETTINGS_PATH, "r", encoding="utf-8") as f:
-                saved = json.load(f)
-                # Verify account_id was saved
-                saved_account_id = saved.get("account_id", "")
-                print(f"DEBUG: Verified saved account_id: '{saved_account_id}'")
-                if "account_id" in saved:
-                    return True
-        except Exception as e:
-            print(f"DEBUG: Error verifying save: {e}")
+        _write_settings_file(_MVR_SETTINGS_PATH, settings)
     except Exception as e:
         # Log error but don't crash
-        print(f"DEBUG: Error saving MVR settings: {e}")
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Error saving MVR settings: %s", e)
         return False
     return True
 
@@ -149,11 +257,9 @@ def _save_mvr_settings(settings):
 def _load_ui_settings():
     """Load UI settings (display size) from file"""
     try:
-        if os.path.isfile(_MVR_UI_SETTINGS_PATH):
-            with open(_MVR_UI_SETTINGS_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    return {**_DEFAULT_UI_SETTINGS, **data}
+        data = _read_settings_json(_MVR_UI_SETTINGS_PATH)
+        if isinstance(data, dict):
+            return {**_DEFAULT_UI_SETTINGS, **data}
     except Exception:
         pass
     return dict(_DEFAULT_UI_SETTINGS)
@@ -163,8 +269,7 @@ def _save_ui_settings(settings):
     """Save UI settings to file"""
     try:
         os.makedirs(os.path.dirname(_MVR_UI_SETTINGS_PATH), exist_ok=True)
-        with open(_MVR_UI_SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2, ensure_ascii=False)
+        _write_settings_file(_MVR_UI_SETTINGS_PATH, settings)
         return True
     except Exception:
         return False
@@ -172,13 +277,14 @@ def _save_ui_settings(settings):
 
 def _apply_display_size(root, size_key):
     """Apply display size settings to the window"""
+    # Re-selecting the current size would only restyle every widget and reset the geometry
+    if getattr(root, "_mvr_last_size", None) == size_key:
+        return
     preset = _SIZE_PRESETS.get(size_key, _SIZE_PRESETS["Medium"])
     font_size = preset["font_size"]
     
     # Apply font size to ttk styles
-    style = ttk.Style(root)
     try:
-        style.configure("TLabel", font=("Segoe UI", font_size))
         # Configure button with padding tuple: (horizontal, vertical)
         # Ensure vertical padding keeps text centered and visible
         button_pad = preset["button_padding"]
@@ -191,12 +297,15 @@ def _apply_display_size(root, size_key):
             extra_vertical = max(4, int(font_size * 0.5))  # More aggressive for Large
         else:
             extra_vertical = max(2, int(font_size * 0.3))  # Scale extra padding with font size
-        style.configure("TButton", 
-                       font=("Segoe UI", font_size), 
-                       padding=(button_pad, button_pad + extra_vertical))  # Extra vertical padding
-        style.configure("TEntry", font=("Segoe UI", font_size))
-        style.configure("TCombobox", font=("Segoe UI", font_size))
-        style.configure("TCheckbutton", font=("Segoe UI", font_size))
+        # All five styles go to Tcl as one script - a single interpreter round-trip
+        font_spec = f"{{{{Segoe UI}} {font_size}}}"
+        root.tk.eval(
+            f"ttk::style configure TLabel -font {font_spec}\n"
+            f"ttk::style configure TButton -font {font_spec} -padding {{{button_pad} {button_pad + extra_vertical}}}\n"
+            f"ttk::style configure TEntry -font {font_spec}\n"
+            f"ttk::style configure TCombobox -font {font_spec}\n"
+            f"ttk::style configure TCheckbutton -font {font_spec}\n"
+        )
     except Exception:
         pass
     
@@ -236,37 +345,122 @@ def _apply_display_size(root, size_key):
             root.geometry(f"{new_width}x{new_height}")
     except Exception:
         pass
+    root._mvr_last_size = size_key
+
+
+# Probe results reused for this many seconds so back-to-back checks don't repeat the syscalls
+_PROBE_TTL = 1.0
+_PORT_PROBE_CACHE: Dict[Tuple[str, int], Tuple[bool, float]] = {}
+_CHROME_RUNNING_CACHE = [False, 0.0]  # [result, expiry]
 
 
 def _is_port_open(host: str, port: int, timeout: float = 0.25) -> bool:
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    s.settimeout(timeout)
+    now = time.monotonic()
+    cached = _PORT_PROBE_CACHE.get((host, port))
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            result = True
+    except OSError:
+        result = False
+    _PORT_PROBE_CACHE[(host, port)] = (result, time.monotonic() + _PROBE_TTL)
+    return result
+
+
+@lru_cache(maxsize=1)
+def _toolhelp_api():
+    """(kernel32, PROCESSENTRY32W) for Toolhelp32 process snapshots, or None off Windows"""
+    if sys.platform != "win32":
+        return None
     try:
-        return s.connect_ex((host, port)) == 0
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESSENTRY32W(ctypes.Structure):
+            _fields_ = [
+                ("dwSize", wintypes.DWORD),
+                ("cntUsage", wintypes.DWORD),
+                ("th32ProcessID", wintypes.DWORD),
+                ("th32DefaultHeapID", ctypes.c_size_t),
+                ("th32ModuleID", wintypes.DWORD),
+                ("cntThreads", wintypes.DWORD),
+                ("th32ParentProcessID", wintypes.DWORD),
+                ("pcPriClassBase", wintypes.LONG),
+                ("dwFlags", wintypes.DWORD),
+                ("szExeFile", wintypes.WCHAR * 260),
+            ]
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateToolhelp32Snapshot.argtypes = (wintypes.DWORD, wintypes.DWORD)
+        kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+        kernel32.Process32FirstW.argtypes = (wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W))
+        kernel32.Process32FirstW.restype = wintypes.BOOL
+        kernel32.Process32NextW.argtypes = (wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W))
+        kernel32.Process32NextW.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        return kernel32, PROCESSENTRY32W
+    except Exception:
+        return None
+
+
+def _chrome_in_process_snapshot() -> Optional[bool]:
+    """Scan a Toolhelp32 snapshot for a Chrome process; None if the API is unavailable"""
+    api = _toolhelp_api()
+    if api is None:
+        return None
+    import ctypes
+    kernel32, PROCESSENTRY32W = api
+    TH32CS_SNAPPROCESS = 0x00000002
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == ctypes.c_void_p(-1).value:  # INVALID_HANDLE_VALUE
+        return None
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        more = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while more:
+            # Substring check covers both "chrome" and "chrome.exe"
+            if "chrome" in entry.szExeFile.lower():
+                return True
+            more = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+        return False
     finally:
-        try:
-            s.close()
-        except Exception:
-            pass
+        kernel32.CloseHandle(snapshot)
 
 
 def _is_chrome_running() -> bool:
     """
     Quick check if any Chrome process is running.
     """
-    if not psutil:
-        return False
+    now = time.monotonic()
+    if _CHROME_RUNNING_CACHE[1] > now:
+        return _CHROME_RUNNING_CACHE[0]
+    # On Windows walk a Toolhelp32 snapshot directly; psutil builds a Python object per process
     try:
-        for p in psutil.process_iter(attrs=["name"]):
-            name = (p.info.get("name") or "").lower()
-            if "chrome" in name or "chrome.exe" in name:
-                return True
+        result = _chrome_in_process_snapshot()
     except Exception:
-        pass
-    return False
+        result = None
+    if result is None:
+        psutil = _get_psutil()
+        if not psutil:
+            return False
+        result = False
+        try:
+            for p in psutil.process_iter(attrs=["name"]):
+                # Substring check covers both "chrome" and "chrome.exe"
+                if "chrome" in (p.info.get("name") or "").lower():
+                    result = True
+                    break
+        except Exception:
+            pass
+    _CHROME_RUNNING_CACHE[:] = [result, time.monotonic() + _PROBE_TTL]
+    return result
 
+@lru_cache(maxsize=1)
 def _find_chrome_executable():
-    """Find Chrome executable path on Windows"""
+    """Find Chrome executable path on Windows (resolved once per session)"""
     possible_paths = [
         r"C:\Program Files\Google\Chrome\Application\chrome.exe",
         r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
@@ -279,27 +473,214 @@ def _find_chrome_executable():
             return path
     return None
 
+# Extracted text keyed by (path, mtime_ns, size) so re-selecting a file skips PyMuPDF
+_PDF_TEXT_CACHE_MAX = 16
+_PDF_TEXT_CACHE: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_PDF_TEXT_CACHE_LOCK = threading.Lock()
+
+
 def _extract_text_from_pdf(pdf_path: str) -> str:
     """
     Fast extraction for text-based PDFs using PyMuPDF.
+    Results are cached until the file changes on disk.
     """
+    st = os.stat(pdf_path)
+    key = (os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size)
+    with _PDF_TEXT_CACHE_LOCK:
+        cached = _PDF_TEXT_CACHE.get(key)
+        if cached is not None:
+            _PDF_TEXT_CACHE.move_to_end(key)
+            return cached
+    text = _read_pdf_text(pdf_path)
+    with _PDF_TEXT_CACHE_LOCK:
+        _PDF_TEXT_CACHE[key] = text
+        _PDF_TEXT_CACHE.move_to_end(key)
+        while len(_PDF_TEXT_CACHE) > _PDF_TEXT_CACHE_MAX:
+            _PDF_TEXT_CACHE.popitem(last=False)
+    return text
+
+
+def _read_pdf_text(pdf_path: str) -> str:
+    """Extract text from every page of the PDF (uncached)"""
+    fitz = _get_fitz()
     if not fitz:
         raise RuntimeError("PyMuPDF is not installed. Please install 'pymupdf'.")
-    doc = fitz.open(pdf_path)
+    # Map the file read-only so pages are paged in on demand instead of copied up front
+    mm = None
+    with open(pdf_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mm = None  # Empty file or mapping not supported - open by path below
     try:
-        parts = []
-        for page in doc:
-            # Use blocks to preserve reading order better than plain text
-            parts.append(page.get_text("blocks"))
-        # Flatten blocks into lines; each block is a tuple (x0, y0, x1, y1, text, block_no, block_type)
-        lines = []
-        for blocks in parts:
-            for b in blocks:
-                if len(b) >= 5 and isinstance(b[4], str):
-                    lines.append(b[4].strip())
-        return "\n".join([ln for ln in lines if ln])
+        try:
+            doc = fitz.open(stream=mm, filetype="pdf") if mm is not None else fitz.open(pdf_path)
+        except TypeError:
+            # Older PyMuPDF versions only accept bytes for stream=
+            doc = fitz.open(pdf_path)
+        try:
+            # Plain text comes out in the same block order as get_text("blocks") without
+            # building a bbox tuple per block; the field patterns tolerate the extra whitespace
+            return "\n".join([page.get_text("text") for page in doc]).strip()
+        finally:
+            doc.close()
     finally:
-        doc.close()
+        # Also reached when fitz.open fails, so the mapping never outlives this call
+        if mm is not None:
+            try:
+                mm.close()
+            except BufferError:
+                pass
+
+
+# Field patterns for _parse_mvr_fields as (compiled pattern, value group), tried in order
+_LICENSE_PATTERNS = tuple((re.compile(pat), group_idx) for pat, group_idx in (
+    (r"(?i)\b(Driver'?s?\s*License|DL|License\s*(?:No|Number|#)?\.?)\s*:?\s*([A-Z0-9\-]{4,})", 2),
+    (r"(?i)\bLicense\s*:?\s*([A-Z0-9\-]{4,})", 1),
+    (r"(?i)\bDL\s*:?\s*([A-Z0-9\-]{4,})", 1),
+))
+
+_DOB_PATTERNS = tuple((re.compile(pat), group_idx) for pat, group_idx in (
+    (r"(?i)\b(DOB|Date\s+of\s+Birth|Birth\s+Date)\s*:?\s*([0-9]{1,2}[/\-][0-9]{1,2}[/\-][0-9]{2,4})", 2),
+    (r"(?i)\bDOB\s*:?\s*([0-9]{1,2}[/\-][0-9]{1,2}[/\-][0-9]{2,4})", 1),
+    (r"\b([0-9]{1,2}[/\-][0-9]{1,2}[/\-][0-9]{2,4})\b", 1),  # Any date-like pattern
+))
+
+_NAME_PATTERNS = tuple((re.compile(pat), group_idx) for pat, group_idx in (
+    (r"(?i)\b(Name|Driver\s+Name|Full\s+Name)\s*:?\s*([A-Z][A-Za-z ,.'-]+)", 2),
+    (r"(?i)\bName\s*:?\s*([A-Z][A-Za-z ,.'-]+)", 1),
+))
+
+# US state abbreviations (2 letters) and full state names
+_STATE_PATTERNS = tuple((re.compile(pat, re.MULTILINE), group_idx) for pat, group_idx in (
+    # HIGHEST PRIORITY: SambaSafety format - "[State Name] Driver Record - [Account ID]"
+    (r"(?i)^\s*([A-Z][A-Z\s]+?)\s+Driver\s+Record\s*-\s*[A-Z0-9]+\s*$", 1),  # Full state name before "Driver Record -"
+    (r"(?i)([A-Z][A-Z\s]+?)\s+Driver\s+Record\s*-\s*[A-Z0-9]+", 1),  # Full state name before "Driver Record -" (anywhere in text)
+    # Patterns with explicit "State" label
+    (r"(?i)\b(State|State\s+of\s+Issue|Issuing\s+State|License\s+State|State\s+Code)\s*:?\s*([A-Z]{2})\b", 2),  # 2-letter abbreviation with label
+    (r"(?i)\b(State|State\s+of\s+Issue|Issuing\s+State|License\s+State|State\s+Code)\s*:?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b", 2),  # Full state name with label
+    # Patterns without explicit label (context-based)
+    (r"\b([A-Z]{2})\s+(?:Driver|License|DL|MVR|Drivers?)\b", 1),  # State abbreviation before "Driver" or "License"
+    (r"\b(?:Driver|License|DL|MVR|Drivers?)\s+([A-Z]{2})\b", 1),  # State abbreviation after "Driver" or "License"
+    (r"\b([A-Z]{2})\s+[0-9]{4,}\b", 1),  # State abbreviation followed by numbers (likely license number)
+    # Standalone state abbreviations in common contexts
+    (r"(?i)\b(State|State\s+Code)\s*:?\s*([A-Z]{2})\b", 2),  # Just "State:" or "State Code:" followed by abbreviation
+    (r"(?i)\b(State|State\s+Code)\s*:?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b", 2),  # Just "State:" or "State Code:" followed by full name
+    # Look for state names/abbreviations near other license fields
+    (r"(?i)(?:License|DL|MVR|Driver).*?(?:State|State\s+of\s+Issue|Issuing\s+State)\s*:?\s*([A-Z]{2})\b", 1),  # State abbrev near license keywords
+    (r"(?i)(?:License|DL|MVR|Driver).*?(?:State|State\s+of\s+Issue|Issuing\s+State)\s*:?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b", 1),  # State name near license keywords
+))
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+# Valid two-letter state codes (plus DC) accepted as a parsed state
+_US_STATE_ABBREVS = frozenset({"AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC"})
+
+# Mapping from full state names to abbreviations
+_STATE_NAME_TO_ABBREV = {
+    "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR", "CALIFORNIA": "CA",
+    "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE", "FLORIDA": "FL", "GEORGIA": "GA",
+    "HAWAII": "HI", "IDAHO": "ID", "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA",
+    "KANSAS": "KS", "KENTUCKY": "KY", "LOUISIANA": "LA", "MAINE": "ME", "MARYLAND": "MD",
+    "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MINNESOTA": "MN", "MISSISSIPPI": "MS", "MISSOURI": "MO",
+    "MONTANA": "MT", "NEBRASKA": "NE", "NEVADA": "NV", "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ",
+    "NEW MEXICO": "NM", "NEW YORK": "NY", "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "OHIO": "OH",
+    "OKLAHOMA": "OK", "OREGON": "OR", "PENNSYLVANIA": "PA", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC",
+    "SOUTH DAKOTA": "SD", "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT", "VERMONT": "VT",
+    "VIRGINIA": "VA", "WASHINGTON": "WA", "WEST VIRGINIA": "WV", "WISCONSIN": "WI", "WYOMING": "WY",
+    "DISTRICT OF COLUMBIA": "DC", "WASHINGTON DC": "DC", "DC": "DC"
+}
+
+# Every 3+ character fragment of a state name -> abbreviation of the first state (in the
+# order above) containing it, for candidates that only captured part of a name
+_STATE_FRAGMENT_MAP: Dict[str, str] = {}
+for _state_name, _abbrev in _STATE_NAME_TO_ABBREV.items():
+    for _start in range(len(_state_name)):
+        for _end in range(_start + 3, len(_state_name) + 1):
+            _STATE_FRAGMENT_MAP.setdefault(_state_name[_start:_end], _abbrev)
+
+
+# Non-ASCII characters that (?i) matching treats as ASCII letters; mapped before lower()
+# so keyword checks on the folded text never miss a text the patterns could match
+_KEYWORD_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+# Literals each _STATE_PATTERNS entry needs, as (all of - folded text, any of - folded text,
+# any of - raw text for case-sensitive patterns). Patterns whose literals are absent are skipped.
+_STATE_PATTERN_GATES = (
+    (("driver", "record"), (), ()),
+    (("driver", "record"), (), ()),
+    (("state",), (), ()),
+    (("state",), (), ()),
+    ((), (), ("Driver", "License", "DL", "MVR")),
+    ((), (), ("Driver", "License", "DL", "MVR")),
+    ((), (), ()),
+    (("state",), (), ()),
+    (("state",), (), ()),
+    (("state",), ("license", "dl", "mvr", "driver"), ()),
+    (("state",), ("license", "dl", "mvr", "driver"), ()),
+)
+
+
+def _first_state_match(text: str) -> Optional[str]:
+    """
+    Value captured by the first matching _STATE_PATTERNS entry, in priority order.
+    One case-folded copy of the text lets patterns that cannot match skip their scan.
+    """
+    folded = text.translate(_KEYWORD_FOLD).lower()
+    for (pat, group_idx), (all_folded, any_folded, any_raw) in zip(_STATE_PATTERNS, _STATE_PATTERN_GATES):
+        if all_folded and not all(k in folded for k in all_folded):
+            continue
+        if any_folded and not any(k in folded for k in any_folded):
+            continue
+        if any_raw and not any(k in text for k in any_raw):
+            continue
+        m = pat.search(text)
+        if m:
+            return m.group(group_idx)
+    return None
+
+
+# Characters allowed in a name value (mirrors the [A-Za-z ,.'-] class in the name regexes;
+# under (?i) that class also matches the four non-ASCII case variants listed last)
+_NAME_VALUE_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz ,.'-\u0130\u0131\u017f\u212a")
+
+# "FIRST [MIDDLE...] LAST [SUFFIX]" split in one match.
+# "last" + "suffix" only match for 3+ words; otherwise "plain_last" holds the last word.
+_NAME_NO_COMMA_RE = re.compile(
+    r"^(?P<first>\S+)(?:\s+\S+)*?\s+"
+    r"(?:(?P<last>\S+)\s+(?P<suffix>(?:Jr|Sr|II|III|IV|V|Esq)[.,]*)|(?P<plain_last>\S+))$"
+)
+
+def _name_from_label_line(text: str) -> Optional[str]:
+    """
+    Cheap substring scan for a "Name:" / "NAME:" / "Driver Name:" line.
+    Returns the name value, or None when the regex patterns should decide.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Some non-ASCII characters change length when lowered; indexes would not line up
+        return None
+    idx = lowered.find("name")
+    if idx < 0 or text[idx + 4:idx + 5] != ":":
+        return None
+    # Same word boundary the regexes use (\bName)
+    if idx > 0 and (text[idx - 1].isalnum() or text[idx - 1] == "_"):
+        return None
+    start = idx + 5
+    end = text.find("\n", start)
+    line = text[start:end if end >= 0 else len(text)].lstrip()
+    if not line or line[0] not in _NAME_VALUE_CHARS or not line[0].isalpha():
+        return None
+    n = 0
+    for ch in line:
+        if ch not in _NAME_VALUE_CHARS:
+            break
+        n += 1
+    if n < 2:
+        # The regexes need at least two name characters; let them keep searching
+        return None
+    return line[:n].strip()
 
 
 def _parse_mvr_fields(text: str) -> Dict[str, str]:
@@ -308,176 +689,105 @@ def _parse_mvr_fields(text: str) -> Dict[str, str]:
     Heuristic parsing - may need tuning for specific MVR formats.
     Users can edit results in the UI.
     """
+    # Callers modify the result (e.g. DOB formatting), so hand out a copy of the cached dict
+    return dict(_parse_mvr_fields_cached(text))
+
+
+@lru_cache(maxsize=32)
+def _parse_mvr_fields_cached(text: str) -> Dict[str, str]:
+    """Memoized parse - re-selecting the same PDF reuses the previous result"""
     results: Dict[str, str] = {}
     
     # License Number - try multiple patterns
-    license_patterns = [
-        (r"(?i)\b(Driver'?s?\s*License|DL|License\s*(?:No|Number|#)?\.?)\s*:?\s*([A-Z0-9\-]{4,})", 2),
-        (r"(?i)\bLicense\s*:?\s*([A-Z0-9\-]{4,})", 1),
-        (r"(?i)\bDL\s*:?\s*([A-Z0-9\-]{4,})", 1),
-    ]
-    for pat, group_idx in license_patterns:
-        m = re.search(pat, text)
+    for pat, group_idx in _LICENSE_PATTERNS:
+        m = pat.search(text)
         if m:
             results["license_number"] = m.group(group_idx).strip()
             break
     
     # DOB - multiple date formats
-    dob_patterns = [
-        (r"(?i)\b(DOB|Date\s+of\s+Birth|Birth\s+Date)\s*:?\s*([0-9]{1,2}[/\-][0-9]{1,2}[/\-][0-9]{2,4})", 2),
-        (r"(?i)\bDOB\s*:?\s*([0-9]{1,2}[/\-][0-9]{1,2}[/\-][0-9]{2,4})", 1),
-        (r"\b([0-9]{1,2}[/\-][0-9]{1,2}[/\-][0-9]{2,4})\b", 1),  # Any date-like pattern
-    ]
-    for pat, group_idx in dob_patterns:
-        m = re.search(pat, text)
+    for pat, group_idx in _DOB_PATTERNS:
+        m = pat.search(text)
         if m:
             results["dob"] = m.group(group_idx).strip()
             break
     
     # Name - try to split into Last, First
     # Handles: middle names, multiple last names, suffixes (Jr., Sr., III, etc.)
-    name_patterns = [
-        (r"(?i)\b(Name|Driver\s+Name|Full\s+Name)\s*:?\s*([A-Z][A-Za-z ,.'-]+)", 2),
-        (r"(?i)\bName\s*:?\s*([A-Z][A-Za-z ,.'-]+)", 1),
-    ]
-    full_name = ""
-    for pat, group_idx in name_patterns:
-        m = re.search(pat, text)
-        if m:
-            full_name = m.group(group_idx).strip()
-            break
+    # Fast path: most MVRs have a plain "Name: SMITH, JOHN" line, no regex needed
+    full_name = _name_from_label_line(text)
+    if full_name is None:
+        full_name = ""
+        for pat, group_idx in _NAME_PATTERNS:
+            m = pat.search(text)
+            if m:
+                full_name = m.group(group_idx).strip()
+                break
     
     if full_name:
-        # Common suffixes that should be part of last name
-        suffixes = ["Jr", "Jr.", "Sr", "Sr.", "II", "III", "IV", "V", "Esq", "Esq."]
-        
         # Try "LAST, FIRST MIDDLE" format first (comma-separated)
         if "," in full_name:
-            parts = [p.strip() for p in full_name.split(",", 1)]
-            if len(parts) == 2:
-                results["last_name"] = parts[0].strip()
-                # First name = first word only (ignore middle names)
-                first_part = parts[1].strip()
-                first_words = first_part.split()
-                results["first_name"] = first_words[0].strip() if first_words else ""
-            else:
-                # Fallback: treat as single name
-                results["last_name"] = full_name.strip()
-                results["first_name"] = ""
+            last, _, first_part = full_name.partition(",")
+            results["last_name"] = last.strip()
+            # First name = first word only (ignore middle names)
+            first_words = first_part.split(None, 1)
+            results["first_name"] = first_words[0] if first_words else ""
         else:
             # No comma: assume "FIRST MIDDLE LAST" or "FIRST LAST LAST" format
             # First name = first word only, Last name = last word(s)
-            parts = full_name.split()
-            if len(parts) >= 2:
-                # Check if last word is a suffix - if so, include it with last name
-                last_word = parts[-1].rstrip(".,")
-                if last_word in suffixes and len(parts) >= 3:
+            m = _NAME_NO_COMMA_RE.match(full_name)
+            if m:
+                results["first_name"] = m.group("first")
+                if m.group("last"):
                     # Last name includes suffix: "Smith Jr." or "Garcia Lopez Jr."
-                    results["last_name"] = " ".join(parts[-2:]).strip()
-                    results["first_name"] = parts[0].strip()  # First word only
+                    results["last_name"] = f"{m.group('last')} {m.group('suffix')}"
                 else:
                     # Standard case: first word = first name, last word = last name
                     # Handles: "CHERRI DANIELLE JACKSON" -> First: "CHERRI", Last: "JACKSON"
-                    # Handles: "John Michael Smith" -> First: "John", Last: "Smith"
-                    # For multiple last names (e.g., "Maria Garcia Lopez"), 
+                    # For multiple last names (e.g., "Maria Garcia Lopez"),
                     # user can manually combine them if needed
-                    results["last_name"] = parts[-1].strip()
-                    results["first_name"] = parts[0].strip()  # First word only
-            elif len(parts) == 1:
+                    results["last_name"] = m.group("plain_last")
+            else:
                 # Single name - put in last name as fallback
-                results["last_name"] = parts[0].strip()
+                results["last_name"] = full_name
                 results["first_name"] = ""
     
-    # State - try multiple patterns
-    # US state abbreviations (2 letters) and full state names
-    state_patterns = [
-        # HIGHEST PRIORITY: SambaSafety format - "[State Name] Driver Record - [Account ID]"
-        (r"(?i)^\s*([A-Z][A-Z\s]+?)\s+Driver\s+Record\s*-\s*[A-Z0-9]+\s*$", 1),  # Full state name before "Driver Record -"
-        (r"(?i)([A-Z][A-Z\s]+?)\s+Driver\s+Record\s*-\s*[A-Z0-9]+", 1),  # Full state name before "Driver Record -" (anywhere in text)
-        # Patterns with explicit "State" label
-        (r"(?i)\b(State|State\s+of\s+Issue|Issuing\s+State|License\s+State|State\s+Code)\s*:?\s*([A-Z]{2})\b", 2),  # 2-letter abbreviation with label
-        (r"(?i)\b(State|State\s+of\s+Issue|Issuing\s+State|License\s+State|State\s+Code)\s*:?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b", 2),  # Full state name with label
-        # Patterns without explicit label (context-based)
-        (r"\b([A-Z]{2})\s+(?:Driver|License|DL|MVR|Drivers?)\b", 1),  # State abbreviation before "Driver" or "License"
-        (r"\b(?:Driver|License|DL|MVR|Drivers?)\s+([A-Z]{2})\b", 1),  # State abbreviation after "Driver" or "License"
-        (r"\b([A-Z]{2})\s+[0-9]{4,}\b", 1),  # State abbreviation followed by numbers (likely license number)
-        # Standalone state abbreviations in common contexts
-        (r"(?i)\b(State|State\s+Code)\s*:?\s*([A-Z]{2})\b", 2),  # Just "State:" or "State Code:" followed by abbreviation
-        (r"(?i)\b(State|State\s+Code)\s*:?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b", 2),  # Just "State:" or "State Code:" followed by full name
-        # Look for state names/abbreviations near other license fields
-        (r"(?i)(?:License|DL|MVR|Driver).*?(?:State|State\s+of\s+Issue|Issuing\s+State)\s*:?\s*([A-Z]{2})\b", 1),  # State abbrev near license keywords
-        (r"(?i)(?:License|DL|MVR|Driver).*?(?:State|State\s+of\s+Issue|Issuing\s+State)\s*:?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b", 1),  # State name near license keywords
-    ]
-    # Also check for common state abbreviations in context
-    us_states_abbrev = ["AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC"]
-    
-    # Mapping from full state names to abbreviations
-    state_name_to_abbrev = {
-        "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR", "CALIFORNIA": "CA",
-        "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE", "FLORIDA": "FL", "GEORGIA": "GA",
-        "HAWAII": "HI", "IDAHO": "ID", "ILLINOIS": "IL", "INDIANA": "IN", "IOWA": "IA",
-        "KANSAS": "KS", "KENTUCKY": "KY", "LOUISIANA": "LA", "MAINE": "ME", "MARYLAND": "MD",
-        "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MINNESOTA": "MN", "MISSISSIPPI": "MS", "MISSOURI": "MO",
-        "MONTANA": "MT", "NEBRASKA": "NE", "NEVADA": "NV", "NEW HAMPSHIRE": "NH", "NEW JERSEY": "NJ",
-        "NEW MEXICO": "NM", "NEW YORK": "NY", "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND", "OHIO": "OH",
-        "OKLAHOMA": "OK", "OREGON": "OR", "PENNSYLVANIA": "PA", "RHODE ISLAND": "RI", "SOUTH CAROLINA": "SC",
-        "SOUTH DAKOTA": "SD", "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT", "VERMONT": "VT",
-        "VIRGINIA": "VA", "WASHINGTON": "WA", "WEST VIRGINIA": "WV", "WISCONSIN": "WI", "WYOMING": "WY",
-        "DISTRICT OF COLUMBIA": "DC", "WASHINGTON DC": "DC", "DC": "DC"
-    }
-    
-    for pat, group_idx in state_patterns:
-        m = re.search(pat, text, re.MULTILINE)
-        if m:
-            state_candidate = m.group(group_idx).strip()
-            state_candidate_upper = state_candidate.upper()
-            
-            # Clean up the state candidate - remove extra whitespace
-            state_candidate_upper = re.sub(r'\s+', ' ', state_candidate_upper)
-            
-            # If it's a 2-letter code, verify it's a valid state
-            if len(state_candidate_upper) == 2 and state_candidate_upper in us_states_abbrev:
-                results["state"] = state_candidate_upper
-                break
-            # If it's a full state name, convert to abbreviation
-            elif state_candidate_upper in state_name_to_abbrev:
-                results["state"] = state_name_to_abbrev[state_candidate_upper]
-                break
-            # Try exact match first (for multi-word states like "NEW YORK")
-            else:
-                # Check if any state name matches exactly (case-insensitive)
-                matched = False
-                for state_name, abbrev in state_name_to_abbrev.items():
-                    if state_candidate_upper == state_name:
-                        results["state"] = abbrev
-                        matched = True
-                        break
-                
-                if not matched:
-                    # Try partial match for state names (e.g., "New York" might be captured as "New" or "York")
-                    # Check if any state name contains this candidate (case-insensitive)
-                    for state_name, abbrev in state_name_to_abbrev.items():
-                        # Check if candidate is at the start of state name (for multi-word states)
-                        if state_name.startswith(state_candidate_upper) or state_candidate_upper in state_name:
-                            # Make sure it's a reasonable match (not too short)
-                            if len(state_candidate_upper) >= 3:  # At least 3 characters to avoid false matches
-                                results["state"] = abbrev
-                                matched = True
-                                break
-                
-                if matched:
-                    break
-                break
+    # State - try multiple patterns (see _STATE_PATTERNS)
+    # Highest-priority state pattern that matches (keyword-gated, see _STATE_PATTERN_GATES)
+    state_candidate = _first_state_match(text)
+    if state_candidate is not None:
+        state_candidate_upper = state_candidate.strip().upper()
+        
+        # Clean up the state candidate - remove extra whitespace
+        state_candidate_upper = _WHITESPACE_RE.sub(' ', state_candidate_upper)
+        
+        # If it's a 2-letter code, verify it's a valid state
+        if len(state_candidate_upper) == 2 and state_candidate_upper in _US_STATE_ABBREVS:
+            results["state"] = state_candidate_upper
+        else:
+            # Full state name (including multi-word states like "NEW YORK"), convert to abbreviation
+            # otherwise try a partial match (e.g., "New York" might be captured as "New" or "York");
+            # the fragment map only holds 3+ character fragments to avoid false matches
+            abbrev = _STATE_NAME_TO_ABBREV.get(state_candidate_upper) or _STATE_FRAGMENT_MAP.get(state_candidate_upper)
+            if abbrev is not None:
+                results["state"] = abbrev
     
     return results
 
 
+def _require_sync_playwright():
+    """sync_playwright, raising a readable error if playwright is missing"""
+    sync_playwright = _get_sync_playwright()
+    if sync_playwright is None:
+        raise RuntimeError("playwright is not installed. Run: pip install playwright && playwright install")
+    return sync_playwright
+
+
 def _ensure_playwright_browsers_installed(status_cb=None) -> None:
     """
     Make sure Playwright has installed browsers. If not, attempt a one-time install.
     """
-    if sync_playwright is None:
-        raise RuntimeError("playwright is not installed. Run: pip install playwright && playwright install")
+    sync_playwright = _require_sync_playwright()
     try:
         with sync_playwright() as p:
             # Try launching quickly; if missing browsers, it will throw
@@ -735,6 +1045,7 @@ def _fill_site_with_playwright(url: str, field_to_selector: Dict[str, str], data
     """
     if status_cb:
         status_cb("Starting browser...")
+    sync_playwright = _require_sync_playwright()
     with sync_playwright() as p:
         browser = None
         context = None
@@ -816,6 +1127,7 @@ def _run_mvr_automation(url: str, field_to_selector: Dict[str, str], data: Dict[
     """
     if status_cb:
         status_cb("Starting browser...")
+    sync_playwright = _require_sync_playwright()
     with sync_playwright() as p:
         # Launch a fresh Playwright Chromium browser (blue icon)
         if status_cb:
@@ -3108,7 +3420,7 @@ def _run_mvr_automation(url: str, field_to_selector: Dict[str, str], data: Dict[
                             
                             # Type DOB character by character to trigger automatic slash insertion
                             # Remove any existing slashes from value (e.g., "01/01/1990" -> "01011990")
-                            dob_digits = ''.join(c for c in value if c.isdigit())
+                            dob_digits = _dob_digits(value)
                             if dob_digits:
                                 # Type each digit with minimal delay to allow auto-formatting
                                 for digit in dob_digits:
@@ -3142,7 +3454,7 @@ def _run_mvr_automation(url: str, field_to_selector: Dict[str, str], data: Dict[
                             # No wait after click - type immediately
                             if field == "dob":
                                 # For DOB, type character by character even in fallback
-                                dob_digits = ''.join(c for c in value if c.isdigit())
+                                dob_digits = _dob_digits(value)
                                 for digit in dob_digits:
                                     page.keyboard.type(digit, delay=2)  # Minimal delay for speed
                             else:
@@ -3178,6 +3490,79 @@ def _run_mvr_automation(url: str, field_to_selector: Dict[str, str], data: Dict[
             pass
 
 
+# File-management button text and base character widths (for Medium font_size=10)
+_FILE_BUTTON_SPECS = (
+    ("Add Files...", 12),
+    ("Remove", 12),
+    ("Clear All", 10),
+    ("Login Settings", 18),
+    ("Site Automation Settings", 22),
+)
+
+# Computed button widths per display size preset
+_BUTTON_WIDTH_CACHE: Dict[str, Tuple[int, ...]] = {}
+
+
+def _file_button_widths(size_name: str) -> Tuple[int, ...]:
+    """Return widths for _FILE_BUTTON_SPECS scaled to a display size preset (cached per size)."""
+    widths = _BUTTON_WIDTH_CACHE.get(size_name)
+    if widths is not None:
+        return widths
+    preset = _SIZE_PRESETS.get(size_name, _SIZE_PRESETS["Medium"])
+    font_size = preset["font_size"]
+    button_padding = preset["button_padding"]
+
+    # For tkinter buttons, width is in characters, but font size affects character width
+    base_font_size = 10.0  # Medium baseline
+    font_scale = font_size / base_font_size
+    # Account for padding changes - larger padding needs more width
+    base_padding = 4.0  # Medium baseline padding
+    padding_scale = button_padding / base_padding
+    # Weighted approach: 80% font scale, 20% padding scale
+    combined_scale = (font_scale * 0.8) + (padding_scale * 0.2)
+    if font_size > base_font_size:
+        # Larger fonts: 20% extra width per point above baseline to prevent text compression
+        combined_scale *= 1.0 + ((font_size - base_font_size) * 0.20)
+
+    out = []
+    for text, base_width in _FILE_BUTTON_SPECS:
+        scaled_width = base_width * combined_scale
+        if font_size < base_font_size:
+            # Don't shrink too much - maintain readability
+            scaled_width = max(scaled_width, base_width * 0.95)
+        # Minimum width: text length + 6 chars, scaled for wider characters
+        min_width = max(int((len(text) + 6) * font_scale), int(base_width * 0.9))
+        out.append(max(int(scaled_width), min_width))
+    widths = _BUTTON_WIDTH_CACHE[size_name] = tuple(out)
+    return widths
+
+
+# Dropped-file tokens from tkinterdnd2: {braced path}, "quoted path" or bare drive path
+_DROP_RE = re.compile(
+    r'\{([^}]+\.pdf)\}|"([A-Za-z]:[^"]+\.pdf)"|([A-Za-z]:[^\s"{}]+\.pdf)(?=[\s"{}]|$)',
+    re.IGNORECASE,
+)
+
+# Copy button (text, width) per display size: icon only on Small, icon + text otherwise
+_COPY_BTN_SIZE_CFG = {"Small": ("📋", 3)}
+_COPY_BTN_DEFAULT_CFG = ("📋 Copy", 10)
+
+# Placeholder row shown in the file listbox when no PDFs are loaded
+_EMPTY_LISTBOX_MSG = "(No files - drag & drop or click 'Add Files...')"
+
+# Deletion table for DOB input: drops every non-digit in the Latin-1 range in one C-level pass
+_DOB_NON_DIGITS = str.maketrans("", "", "".join(c for c in map(chr, range(256)) if not c.isdigit()))
+
+
+def _dob_digits(value: str) -> str:
+    """Return only the digit characters of a DOB string."""
+    digits = value.translate(_DOB_NON_DIGITS)
+    if digits and not digits.isdigit():
+        # Characters outside the table's range - filter the slow way
+        digits = ''.join(filter(str.isdigit, digits))
+    return digits
+
+
 def build_tab(parent):
     """
     Create the MVR Runner tab.
@@ -3415,7 +3800,18 @@ def build_tab(parent):
         
         # Bind to paned window resize events to enforce minimums
         main_paned.bind("<ButtonRelease-1>", lambda e: enforce_visibility())
-        main_paned.bind("<B1-Motion>", lambda e: enforce_visibility())  # Also check during drag
+        # Also check during drag, coalescing motion bursts into one check per 50ms
+        enforce_pending = [None]
+
+        def _run_pending_enforce():
+            enforce_pending[0] = None
+            enforce_visibility()
+
+        def on_paned_drag(event=None):
+            if enforce_pending[0] is None:
+                enforce_pending[0] = main_paned.after(50, _run_pending_enforce)
+
+        main_paned.bind("<B1-Motion>", on_paned_drag)
     except Exception:
         # Fallback: if paneconfigure doesn't work, try setting minimum height on the frame itself
         pass
@@ -3446,6 +3842,7 @@ def build_tab(parent):
     
     # Store file paths (list of full paths, indexed by listbox position)
     pdf_files = []  # List of full file paths
+    pdf_files_set = set()  # Same paths, for O(1) duplicate checks
     
     # Store extracted/edited data per file: {filepath: {license_number: "", last_name: "", first_name: "", dob: "", state: ""}}
     file_data = {}  # Dictionary mapping file paths to their extracted/edited data
@@ -3454,30 +3851,42 @@ def build_tab(parent):
     current_selected_file = None
     
     # Initialize listbox with empty message
-    pdf_listbox.insert(tk.END, "(No files - drag & drop or click 'Add Files...')")
+    pdf_listbox.insert(tk.END, _EMPTY_LISTBOX_MSG)
+    
+    def listbox_rows(start=0):
+        """Numbered listbox rows for pdf_files[start:]"""
+        basename = os.path.basename
+        return [f"{i}. {basename(filepath)}" for i, filepath in enumerate(pdf_files[start:], start + 1)]
     
     def update_listbox_display():
         """Update the listbox to show current files"""
-        pdf_listbox.delete(0, tk.END)
-        if pdf_files:
-            for i, filepath in enumerate(pdf_files):
-                filename = os.path.basename(filepath)
-                pdf_listbox.insert(tk.END, f"{i+1}. {filename}")
-        else:
-            # Always show at least one row, even if empty
-            pdf_listbox.insert(tk.END, "(No files - drag & drop or click 'Add Files...')")
+        # Always show at least one row, even if empty
+        items = listbox_rows() if pdf_files else [_EMPTY_LISTBOX_MSG]
+        # Detach the scrollbar while rebuilding so it is updated once, not after every change
+        pdf_listbox.config(yscrollcommand="")
+        try:
+            pdf_listbox.delete(0, tk.END)
+            # One insert call for all rows instead of one Tcl round-trip per file
+            pdf_listbox.insert(tk.END, *items)
+        finally:
+            pdf_listbox.config(yscrollcommand=scrollbar.set)
+            pdf_listbox.update_idletasks()
     
     def add_files(file_paths):
         """Add one or more files to the list (avoid duplicates)"""
-        added = False
+        first_new = len(pdf_files)
         for p in file_paths:
-            if p and os.path.isfile(p) and p.lower().endswith(".pdf"):
-                # Avoid duplicates
-                if p not in pdf_files:
-                    pdf_files.append(p)
-                    added = True
+            # Avoid duplicates - the O(1) set check runs before the suffix test and stat
+            if p and p not in pdf_files_set and p.lower().endswith(".pdf") and os.path.isfile(p):
+                pdf_files.append(p)
+                pdf_files_set.add(p)
+        added = len(pdf_files) > first_new
         if added:
-            update_listbox_display()
+            if first_new:
+                # Existing rows keep their numbers - only append the new ones
+                pdf_listbox.insert(tk.END, *listbox_rows(first_new))
+            else:
+                update_listbox_display()
         return added
     
     def choose_pdf():
@@ -3497,13 +3906,22 @@ def build_tab(parent):
             idx = selection[0]
             if 0 <= idx < len(pdf_files):
                 filepath = pdf_files.pop(idx)
+                pdf_files_set.discard(filepath)
                 # Also remove saved data for this file
                 if filepath in file_data:
                     del file_data[filepath]
                 # Clear stored selection if this was the selected file
                 if current_selected_file == filepath:
                     current_selected_file = None
-                update_listbox_display()
+                if idx < len(pdf_files):
+                    # Rows above idx keep their numbers - only renumber the tail
+                    pdf_listbox.delete(idx, tk.END)
+                    pdf_listbox.insert(tk.END, *listbox_rows(idx))
+                elif pdf_files:
+                    # Removed the last row - nothing to renumber
+                    pdf_listbox.delete(idx)
+                else:
+                    update_listbox_display()
                 # Clear fields if this was the selected file
                 clear_fields()
     
@@ -3511,6 +3929,7 @@ def build_tab(parent):
         """Clear all files from the list"""
         nonlocal current_selected_file
         pdf_files.clear()
+        pdf_files_set.clear()
         file_data.clear()
         current_selected_file = None
         update_listbox_display()
@@ -3524,53 +3943,23 @@ def build_tab(parent):
             else:
                 var.set("")
         txt.delete("1.0", "end")
+        text_owner[0] = None
     
     def format_dob_value(value):
         """Format a DOB value to __/__/____ format"""
         if not value:
             return "__/__/____"
-        # Remove all non-digits
-        digits = ''.join(filter(str.isdigit, value))
-        if len(digits) == 0:
-            return "__/__/____"
-        # Limit to 8 digits (MMDDYYYY)
-        digits = digits[:8]
-        
-        # Build formatted string
-        formatted = ""
-        if len(digits) >= 1:
-            formatted = digits[0]
-        if len(digits) >= 2:
-            formatted = digits[0:2]
-        if len(digits) >= 3:
-            formatted = digits[0:2] + "/" + digits[2]
-        if len(digits) >= 4:
-            formatted = digits[0:2] + "/" + digits[2:4]
-        if len(digits) >= 5:
-            formatted = digits[0:2] + "/" + digits[2:4] + "/" + digits[4]
-        if len(digits) >= 6:
-            formatted = digits[0:2] + "/" + digits[2:4] + "/" + digits[4:6]
-        if len(digits) >= 7:
-            formatted = digits[0:2] + "/" + digits[2:4] + "/" + digits[4:7]
-        if len(digits) >= 8:
-            formatted = digits[0:2] + "/" + digits[2:4] + "/" + digits[4:8]
-        
-        # Fill remaining with underscores to maintain format
-        while len(formatted) < 10:
-            if len(formatted) == 2:
-                formatted += "/"
-            elif len(formatted) == 5:
-                formatted += "/"
-            else:
-                formatted += "_"
-        
-        return formatted
+        # Remove all non-digits, limit to 8 digits (MMDDYYYY); the key handler passes pure digits
+        digits = (value if value.isdigit() else _dob_digits(value))[:8]
+        # Fill missing positions with underscores to maintain format
+        digits = digits.ljust(8, "_")
+        return f"{digits[0:2]}/{digits[2:4]}/{digits[4:8]}"
     
     def load_file_data(filepath):
         """Load saved data for a file into the fields"""
         if filepath in file_data:
             data = file_data[filepath]
-            for key, var in fields.items():
+            for key, var in field_items:
                 if key == "dob":
                     # Format DOB when loading
                     dob_value = data.get(key, "")
@@ -3581,22 +3970,28 @@ def build_tab(parent):
             if "extracted_text" in data:
                 txt.delete("1.0", "end")
                 txt.insert("1.0", data["extracted_text"])
+                # Text widget now mirrors this file's saved text
+                txt.edit_modified(False)
+                text_owner[0] = filepath
         else:
             clear_fields()
     
     def save_file_data(filepath):
         """Save current field values to file_data"""
         if filepath:
+            values = {key: var.get().strip() for key, var in field_items}
             # Clean DOB - remove underscores, keep digits and slashes
-            dob_value = fields["dob"].get().strip().replace("_", "")
-            file_data[filepath] = {
-                "license_number": fields["license_number"].get().strip(),
-                "last_name": fields["last_name"].get().strip(),
-                "first_name": fields["first_name"].get().strip(),
-                "dob": dob_value,
-                "state": fields["state"].get().strip(),
-                "extracted_text": txt.get("1.0", "end-1c")
-            }
+            values["dob"] = values["dob"].replace("_", "")
+            previous = file_data.get(filepath)
+            if (text_owner[0] == filepath and previous is not None
+                    and "extracted_text" in previous and not txt.edit_modified()):
+                # Text unchanged since it was loaded/saved for this file - skip the copy
+                values["extracted_text"] = previous["extracted_text"]
+            else:
+                values["extracted_text"] = txt.get("1.0", "end-1c")
+                txt.edit_modified(False)
+                text_owner[0] = filepath
+            file_data[filepath] = values
     
     # File management buttons (always visible, not shrinkable) - directly below the list frame
     file_btn_frame = ttk.Frame(file_section_frame)
@@ -3609,7 +4004,27 @@ def build_tab(parent):
     file_mgmt_row.pack(fill="x", pady=(2, 4))  # Added top padding to shift buttons up
     
     # Load saved settings
-    saved_settings = _load_mvr_settings()
+    loaded_settings = _read_mvr_settings()
+    saved_settings = loaded_settings if loaded_settings is not None else _load_mvr_settings()
+    
+    # The loaded dict stays the source of truth for the Save handlers; the file is only
+    # rewritten when the serialized settings differ from what was last read or written.
+    # Defaults (missing or unreadable file) are never treated as already saved.
+    settings_cache = [saved_settings]
+    settings_serialized = [
+        json.dumps(saved_settings, sort_keys=True, ensure_ascii=False)
+        if loaded_settings is not None else None
+    ]
+    
+    def persist_settings():
+        """Write settings_cache[0] to disk if it changed; returns the save result"""
+        serialized = json.dumps(settings_cache[0], sort_keys=True, ensure_ascii=False)
+        if serialized == settings_serialized[0]:
+            return True
+        saved = _save_mvr_settings(settings_cache[0])
+        if saved:
+            settings_serialized[0] = serialized
+        return saved
     
     # Site Automation settings variables (will be used in dialog)
     url_var = tk.StringVar(value=saved_settings.get("url", "https://example.com/"))
@@ -3637,10 +4052,43 @@ def build_tab(parent):
         "password": tk.StringVar(value=saved_settings.get("login_selectors", {}).get("password", "")),
     }
     
+    # Settings dialogs are built on first open, then hidden and re-shown on later opens
+    site_dialog_ref = [None]
+    login_dialog_ref = [None]
+    
+    def _reshow_dialog(dialog_ref):
+        """Re-show a previously built dialog; returns False if it must be (re)built"""
+        dialog = dialog_ref[0]
+        if dialog is None:
+            return False
+        try:
+            if not dialog.winfo_exists():
+                dialog_ref[0] = None
+                return False
+            dialog.deiconify()
+            dialog.lift()
+            dialog.grab_set()  # Make it modal
+            return True
+        except Exception:
+            dialog_ref[0] = None
+            return False
+    
+    def _hide_dialog(dialog):
+        """Hide a settings dialog instead of destroying it so it can be reused"""
+        try:
+            dialog.grab_release()
+        except Exception:
+            pass
+        dialog.withdraw()
+    
     def show_site_automation_dialog():
         """Open full-screen dialog for site automation settings"""
+        if _reshow_dialog(site_dialog_ref):
+            return
         root = outer.winfo_toplevel()
         dialog = tk.Toplevel(root)
+        site_dialog_ref[0] = dialog
+        dialog.protocol("WM_DELETE_WINDOW", lambda: _hide_dialog(dialog))
         dialog.title("Site Automation Settings")
         # Make it large and centered
         dialog.geometry("900x700")
@@ -3649,8 +4097,9 @@ def build_tab(parent):
         
         # Center the dialog
         dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (900 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (700 // 2)
+        sw, sh = dialog.winfo_screenwidth(), dialog.winfo_screenheight()
+        x = (sw // 2) - (900 // 2)
+        y = (sh // 2) - (700 // 2)
         dialog.geometry(f"900x700+{x}+{y}")
         
         # Main container
@@ -3697,7 +4146,7 @@ def build_tab(parent):
         btn_frame.pack(fill="x")
         def on_save_site_settings():
             # Save site automation settings
-            settings = _load_mvr_settings()
+            settings = settings_cache[0]
             settings["url"] = url_var.get().strip()
             settings["selectors"] = {
                 "license_number": sel_vars["license_number"].get().strip(),
@@ -3711,15 +4160,19 @@ def build_tab(parent):
             }
             settings["use_existing_chrome"] = use_existing_var.get()
             settings["debug_port"] = debug_port_var.get().strip()
-            _save_mvr_settings(settings)
-            dialog.destroy()
+            persist_settings()
+            _hide_dialog(dialog)
         ttk.Button(btn_frame, text="Save", command=on_save_site_settings, width=15).pack(side="right", padx=(5, 0))
-        ttk.Button(btn_frame, text="Cancel", command=lambda: dialog.destroy(), width=15).pack(side="right")
+        ttk.Button(btn_frame, text="Cancel", command=lambda: _hide_dialog(dialog), width=15).pack(side="right")
     
     def show_login_settings_dialog():
         """Open dialog for login settings"""
+        if _reshow_dialog(login_dialog_ref):
+            return
         root = outer.winfo_toplevel()
         dialog = tk.Toplevel(root)
+        login_dialog_ref[0] = dialog
+        dialog.protocol("WM_DELETE_WINDOW", lambda: _hide_dialog(dialog))
         dialog.title("Login Settings")
         dialog.geometry("700x650")  # Increased size to ensure buttons are visible
         dialog.transient(root)
@@ -3727,8 +4180,9 @@ def build_tab(parent):
         
         # Center the dialog
         dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (700 // 2)
-        y = (dialog.winfo_screenheight() // 2) - (650 // 2)
+        sw, sh = dialog.winfo_screenwidth(), dialog.winfo_screenheight()
+        x = (sw // 2) - (700 // 2)
+        y = (sh // 2) - (650 // 2)
         dialog.geometry(f"700x650+{x}+{y}")
         
         # Create a container with scrollable content area and fixed button area
@@ -3789,7 +4243,7 @@ def build_tab(parent):
         def on_save_login_settings():
             # Save login settings
             try:
-                settings = _load_mvr_settings()
+                settings = settings_cache[0]
                 
                 # Get values from entry fields
                 account_id_value = account_id_var.get().strip()
@@ -3808,26 +4262,17 @@ def build_tab(parent):
                 }
                 
                 # Save to file
-                save_success = _save_mvr_settings(settings)
+                save_success = persist_settings()
                 
                 if save_success:
-                    # Verify account_id was actually saved
-                    verify_settings = _load_mvr_settings()
-                    if verify_settings.get("account_id") == account_id_value:
-                        # Show confirmation
-                        import tkinter.messagebox as mb
-                        mb.showinfo("Settings Saved", "Login settings have been saved successfully.")
-                    else:
-                        import tkinter.messagebox as mb
-                        mb.showwarning("Save Warning", "Settings may not have saved correctly. Please try again.")
+                    # Show confirmation - _save_mvr_settings reports write failures itself
+                    messagebox.showinfo("Settings Saved", "Login settings have been saved successfully.")
                 else:
-                    import tkinter.messagebox as mb
-                    mb.showerror("Save Error", "Failed to save settings. Please check file permissions.")
+                    messagebox.showerror("Save Error", "Failed to save settings. Please check file permissions.")
                 
-                dialog.destroy()
+                _hide_dialog(dialog)
             except Exception as e:
-                import tkinter.messagebox as mb
-                mb.showerror("Save Error", f"Failed to save settings: {str(e)}")
+                messagebox.showerror("Save Error", f"Failed to save settings: {str(e)}")
         
         # Save button frame - placed right after reCAPTCHA checkbox
         save_btn_frame = ttk.Frame(login_frame)
@@ -3836,7 +4281,7 @@ def build_tab(parent):
         save_btn = ttk.Button(save_btn_frame, text="Save", command=on_save_login_settings, width=15)
         save_btn.pack(side="right", padx=(5, 0))
         
-        cancel_btn = ttk.Button(save_btn_frame, text="Cancel", command=lambda: dialog.destroy(), width=15)
+        cancel_btn = ttk.Button(save_btn_frame, text="Cancel", command=lambda: _hide_dialog(dialog), width=15)
         cancel_btn.pack(side="right")
         
         # CSS Selectors for login fields
@@ -3892,73 +4337,17 @@ def build_tab(parent):
     # Function to update button widths based on display size
     def update_button_widths():
         """Update button widths based on current display size - ensures text is always readable"""
+        buttons = (add_files_btn, remove_btn, clear_all_btn, login_settings_btn, site_automation_btn)
         try:
-            current_size = ui_settings.get("display_size", "Medium")
-            preset = _SIZE_PRESETS.get(current_size, _SIZE_PRESETS["Medium"])
-            font_size = preset["font_size"]
-            button_padding = preset["button_padding"]
-            
-            # Button text and their base character widths (for Medium font_size=10)
-            # These are the minimum widths needed to display the text comfortably
-            button_configs = [
-                (add_files_btn, "Add Files...", 12),
-                (remove_btn, "Remove", 12),
-                (clear_all_btn, "Clear All", 10),
-                (login_settings_btn, "Login Settings", 18),
-                (site_automation_btn, "Site Automation Settings", 22)
-            ]
-            
-            # Calculate scale factor based on font size
-            # For tkinter buttons, width is in characters, but font size affects character width
-            # We need to scale more aggressively to account for larger fonts taking more space
-            base_font_size = 10.0  # Medium baseline
-            font_scale = font_size / base_font_size
-            
-            # Account for padding changes - larger padding needs more width
-            base_padding = 4.0  # Medium baseline padding
-            padding_scale = button_padding / base_padding if base_padding > 0 else 1.0
-            
-            # More aggressive scaling: font size has a bigger impact on character width
-            # Use a weighted approach: 80% font scale, 20% padding scale (increased font weight)
-            combined_scale = (font_scale * 0.8) + (padding_scale * 0.2)
-            
-            # Update each button with properly scaled width
-            for btn, text, base_width in button_configs:
-                # Calculate new width: base width scaled by font and padding
-                scaled_width = base_width * combined_scale
-                
-                # For larger fonts, add extra width to prevent text compression
-                if font_size > base_font_size:
-                    # More aggressive: 20% extra width per point above baseline (increased from 15%)
-                    extra_scale = 1.0 + ((font_size - base_font_size) * 0.20)
-                    scaled_width *= extra_scale
-                
-                # For smaller fonts, ensure we still have enough width
-                elif font_size < base_font_size:
-                    # Don't shrink too much - maintain readability
-                    scaled_width = max(scaled_width, base_width * 0.95)  # Increased from 0.9
-                
-                # Ensure minimum width based on text length with very generous padding
-                text_length = len(text)
-                # Very generous padding: text length + 6 chars for better spacing (increased from 4)
-                # Also scale minimum width by font size to account for wider characters
-                min_width_text = (text_length + 6) * font_scale
-                min_width = max(int(min_width_text), int(base_width * 0.9))
-                
-                # Final width is the maximum of scaled width and minimum width
-                new_width = max(int(scaled_width), min_width)
-                
-                # Configure button with new width
+            widths = _file_button_widths(ui_settings.get("display_size", "Medium"))
+            for btn, new_width in zip(buttons, widths):
                 btn.configure(width=new_width)
-                
-                # Force immediate update to prevent warping
-                btn.update_idletasks()
-                # Also force a full update to ensure layout is recalculated
-                btn.update()
+            # One idle flush lays out all buttons; update() would re-enter the event loop
+            file_mgmt_row.update_idletasks()
         except Exception as e:
             # If there's an error, try to set reasonable defaults
             try:
-                for btn, text, base_width in button_configs:
+                for btn, (text, base_width) in zip(buttons, _FILE_BUTTON_SPECS):
                     # Fallback: use text length + generous padding
                     min_width = len(text) + 6
                     btn.configure(width=max(base_width, min_width))
@@ -3971,14 +4360,23 @@ def build_tab(parent):
     # Initial button width setup
     update_button_widths()
     
-    # After buttons are packed, ensure frames maintain their size and buttons are always visible
-    file_list_frame.update_idletasks()
-    file_btn_frame.update_idletasks()
-    file_mgmt_row.update_idletasks()
+    # After buttons are packed, ensure frames maintain their size and buttons are always visible.
+    # One idle flush lays out every pending widget; the requested heights are read once and reused below.
+    outer.update_idletasks()
+    try:
+        natural_height = file_mgmt_row.winfo_reqheight()
+        btn_frame_height = file_btn_frame.winfo_reqheight()
+        if natural_height == 0 or btn_frame_height == 0:
+            # Buttons might not be visible yet - force a single full refresh and measure again
+            outer.update()
+            natural_height = file_mgmt_row.winfo_reqheight()
+            btn_frame_height = file_btn_frame.winfo_reqheight()
+    except Exception:
+        natural_height = btn_frame_height = 0
     
     # Get the actual required height of the button row to ensure it's always visible
     try:
-        actual_button_height = file_mgmt_row.winfo_reqheight()
+        actual_button_height = natural_height
         if actual_button_height > 0:
             # Set minimum height on the button row frame to match actual button height + padding
             button_frame_min = actual_button_height + 10  # Add padding for frame (top + bottom)
@@ -3996,21 +4394,8 @@ def build_tab(parent):
         pass
     
     # CRITICAL: Ensure buttons are always visible
-    # First, make sure buttons are actually displayed by forcing an update
-    file_mgmt_row.update_idletasks()
-    file_btn_frame.update_idletasks()
-    file_list_frame.update_idletasks()
-    
     # Verify buttons are visible - if not, there's a layout issue
     try:
-        # Check if button row has content
-        natural_height = file_mgmt_row.winfo_reqheight()
-        if natural_height == 0:
-            # Buttons might not be visible - force a refresh
-            file_mgmt_row.update()
-            file_btn_frame.update()
-            natural_height = file_mgmt_row.winfo_reqheight()
-        
         # Set pack_propagate to prevent shrinking, but only if we have content
         if natural_height > 0:
             file_mgmt_row.pack_propagate(False)  # Prevent shrinking - ensures button row maintains size
@@ -4024,19 +4409,38 @@ def build_tab(parent):
     
     # Ensure the button frame maintains its size
     try:
-        btn_frame_height = file_btn_frame.winfo_reqheight()
         if btn_frame_height > 0:
             file_btn_frame.pack_propagate(False)  # Prevent shrinking - ensures button frame maintains size
-        else:
-            # Force update and check again
-            file_btn_frame.update()
-            btn_frame_height = file_btn_frame.winfo_reqheight()
-            if btn_frame_height > 0:
-                file_btn_frame.pack_propagate(False)
     except Exception:
         file_btn_frame.pack_propagate(False)  # Set anyway to prevent shrinking
     
     # Enhanced function to update button layout when display size changes
+    # Set while a coalesced layout pass is queued via after_idle
+    pending_layout = [False]
+    
+    def _do_layout():
+        """Single idle-time layout pass: flush geometry once, then refresh the pane minimum"""
+        pending_layout[0] = False
+        try:
+            file_section_frame.update_idletasks()
+            # Recalculate minimum sizes based on new button sizes
+            actual_button_height = file_mgmt_row.winfo_reqheight()
+            if actual_button_height > 0:
+                button_frame_min = actual_button_height + 10
+                # Get current listbox min based on display size
+                current_size = ui_settings.get("display_size", "Medium")
+                if current_size == "Small":
+                    current_listbox_min = 360
+                else:
+                    current_listbox_min = 120
+                new_min_height = button_frame_min + current_listbox_min + title_and_padding
+                try:
+                    main_paned.paneconfigure(file_section_frame, minsize=new_min_height)
+                except Exception:
+                    pass
+        except Exception:
+            pass
+    
     def update_button_layout():
         """Update button widths and refresh layout when display size changes"""
         try:
@@ -4049,77 +4453,11 @@ def build_tab(parent):
             except Exception:
                 pass
             
-            # Force immediate update of all button frames to prevent warping
-            # Also reconfigure button padding to ensure text is visible
-            buttons_to_update = [
-                add_files_btn, remove_btn, clear_all_btn, 
-                login_settings_btn, site_automation_btn
-            ]
-            for btn in buttons_to_update:
-                btn.update_idletasks()
-                # Re-apply padding to ensure text is properly positioned
-                try:
-                    # Get current style padding and ensure it's applied
-                    btn.update()
-                except Exception:
-                    pass
-                btn.update()
-            
-            # Also update Run button width if it exists
-            try:
-                # Try to call update_run_button_width if it exists in the scope
-                # This will be set up after the button is created
-                pass  # Will be handled by the enhanced_updater if set up
-            except Exception:
-                pass
-            
-            # Update copy buttons if they exist
-            try:
-                for copy_btn in copy_buttons.values():
-                    copy_btn.update_idletasks()
-                    copy_btn.update()
-            except Exception:
-                pass
-            
-            # Force layout refresh at multiple levels - do idletasks first, then full update
-            file_mgmt_row.update_idletasks()
-            file_mgmt_row.update()
-            file_btn_frame.update_idletasks()
-            file_btn_frame.update()
-            file_section_frame.update_idletasks()
-            file_section_frame.update()
-            
-            # Wait a moment for layout to settle, then update again
-            try:
-                # Get root window from any widget
-                root_window = file_section_frame.winfo_toplevel()
-                root_window.after(50, lambda: [
-                    file_mgmt_row.update_idletasks(),
-                    file_btn_frame.update_idletasks(),
-                    file_section_frame.update_idletasks()
-                ])
-            except Exception:
-                pass
-            
-            # Recalculate minimum sizes based on new button sizes
-            try:
-                file_mgmt_row.update_idletasks()
-                actual_button_height = file_mgmt_row.winfo_reqheight()
-                if actual_button_height > 0:
-                    button_frame_min = actual_button_height + 10
-                    # Get current listbox min based on display size
-                    current_size = ui_settings.get("display_size", "Medium")
-                    if current_size == "Small":
-                        current_listbox_min = 360
-                    else:
-                        current_listbox_min = 120
-                    new_min_height = button_frame_min + current_listbox_min + title_and_padding
-                    try:
-                        main_paned.paneconfigure(file_section_frame, minsize=new_min_height)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            # Run button width is handled by the enhanced_updater if set up.
+            # Option changes only mark widgets dirty; one idle pass lays everything out.
+            if not pending_layout[0]:
+                pending_layout[0] = True
+                outer.after_idle(_do_layout)
         except Exception:
             pass
     
@@ -4222,16 +4560,10 @@ def build_tab(parent):
     
     def update_copy_button_texts():
         """Update copy button texts based on current display size"""
-        current_size = ui_settings.get("display_size", "Medium")
-        for key, copy_btn in copy_buttons.items():
-            if current_size == "Small":
-                # Small display: icon only, no text
-                copy_btn.configure(text="📋", width=3)
-            else:
-                # Medium/Large display: icon + text
-                copy_btn.configure(text="📋 Copy", width=10)
-            copy_btn.update_idletasks()
-            copy_btn.update()
+        text, width = _COPY_BTN_SIZE_CFG.get(ui_settings.get("display_size", "Medium"), _COPY_BTN_DEFAULT_CFG)
+        # configure() marks the buttons dirty; Tk redraws them on the next idle pass
+        for copy_btn in copy_buttons.values():
+            copy_btn.configure(text=text, width=width)
     
     def toggle_copy_paste_mode():
         """Toggle between normal mode and copy-paste mode"""
@@ -4284,15 +4616,17 @@ def build_tab(parent):
         "dob": tk.StringVar(),
         "state": tk.StringVar(),
     }
+    # (key, var) pairs bound once for the per-selection save/load helpers
+    field_items = tuple((k, fields[k]) for k in ("license_number", "last_name", "first_name", "dob", "state"))
+    # File whose saved extracted text the text widget currently holds (see save_file_data)
+    text_owner = [None]
     
-    # Clipboard copy function with auto-paste setup
-    auto_paste_enabled = False
-    last_copied_value = None
+    # Clipboard copy / auto-paste state: paste pending, last copied value, active mouse listener
+    paste_state = {"paste": False, "value": None, "listener": None}
+    pynput_available = _PYNPUT_OK
     
     def copy_to_clipboard(value, field_name):
         """Copy value to clipboard and set up auto-paste on next click"""
-        nonlocal auto_paste_enabled, last_copied_value
-        
         if not value or value.strip() == "" or value == "__/__/____":
             return
         
@@ -4304,14 +4638,14 @@ def build_tab(parent):
             # Copy to clipboard
             outer.clipboard_clear()
             outer.clipboard_append(value)
-            outer.update()  # Ensure clipboard is updated
+            outer.update_idletasks()  # Flush idle handlers without re-entering the event loop
             
-            last_copied_value = value
-            auto_paste_enabled = True
+            paste_state["value"] = value
+            paste_state["paste"] = True
             
             # Restart mouse listener if needed
             if pynput_available:
-                if mouse_listener is None:
+                if paste_state["listener"] is None:
                     start_mouse_listener()
             
             # Show brief feedback
@@ -4324,61 +4658,51 @@ def build_tab(parent):
             messagebox.showerror("Copy Error", f"Failed to copy to clipboard: {str(e)}")
     
     # Auto-paste on next click using global mouse hook
-    mouse_listener = None
-    try:
-        from pynput import mouse
-        from pynput.mouse import Listener as MouseListener
-        pynput_available = True
-    except ImportError:
-        pynput_available = False
-        mouse = None
-        MouseListener = None
+    def _auto_paste():
+        """Send Ctrl+V (runs on the Tk main thread)"""
+        try:
+            _PYAUTOGUI.hotkey('ctrl', 'v')
+            set_status("Auto-pasted! Copy another field to paste again")
+        except Exception:
+            set_status("Please press Ctrl+V to paste")
     
     def on_mouse_click(x, y, button, pressed):
         """Handle mouse click - if copy was done, paste on next click"""
-        nonlocal auto_paste_enabled, mouse_listener
-        
-        if pressed and auto_paste_enabled and last_copied_value:
+        state = paste_state
+        if pressed and state["paste"] and state["value"]:
             # User clicked after copying - send Ctrl+V
-            try:
-                import pyautogui
-                # Small delay to ensure click completes first
-                import time
-                time.sleep(0.1)
-                pyautogui.hotkey('ctrl', 'v')
-                auto_paste_enabled = False
-                # Update UI from main thread
-                outer.after(0, lambda: set_status("Auto-pasted! Copy another field to paste again"))
-                # Stop listening after paste
-                if mouse_listener:
-                    mouse_listener.stop()
-                    mouse_listener = None
-            except ImportError:
+            if _PYAUTOGUI is not None:
+                # Paste from the Tk main thread after a short delay so the click completes first;
+                # the listener thread returns immediately instead of sleeping
+                outer.after(100, _auto_paste)
+            else:
                 # Fallback: just notify user to press Ctrl+V
                 outer.after(0, lambda: set_status("Please press Ctrl+V to paste (pyautogui not available)"))
-                auto_paste_enabled = False
-                if mouse_listener:
-                    mouse_listener.stop()
-                    mouse_listener = None
+            state["paste"] = False
+            # Stop listening after paste
+            listener = state["listener"]
+            if listener:
+                listener.stop()
+                state["listener"] = None
     
     def start_mouse_listener():
         """Start listening for mouse clicks"""
-        nonlocal mouse_listener
-        if pynput_available and mouse_listener is None:
+        if pynput_available and paste_state["listener"] is None:
             try:
-                mouse_listener = MouseListener(on_click=on_mouse_click)
-                mouse_listener.start()
+                listener = MouseListener(on_click=on_mouse_click)
+                paste_state["listener"] = listener
+                listener.start()
                 return True
             except Exception:
+                paste_state["listener"] = None
                 return False
         return False
     
-    # Start mouse listener if available
-    if pynput_available:
-        try:
-            start_mouse_listener()
-        except Exception:
-            pass
+    # The mouse listener is started by copy_to_clipboard and stopped after the paste,
+    # so the global hook only runs while a paste is pending
+    
+    # Last (digits, text) written by format_dob_input
+    last_dob = [None, None]
     
     # DOB formatting function
     def format_dob_input(event):
@@ -4386,14 +4710,17 @@ def build_tab(parent):
         widget = event.widget
         current = widget.get()
         
-        # Remove all non-digits and underscores
-        digits = ''.join(filter(str.isdigit, current))
+        # Remove all non-digits and underscores, limit to 8 digits (MMDDYYYY)
+        digits = _dob_digits(current)[:8]
         
-        # Limit to 8 digits (MMDDYYYY)
-        digits = digits[:8]
+        # Navigation/modifier keys leave the text as we last formatted it - nothing to do
+        if digits == last_dob[0] and current == last_dob[1]:
+            return
         
-        # Format with slashes using the helper function
-        formatted = format_dob_value(digits)
+        # Format with slashes - digits are already filtered, so skip the helper's checks
+        d = digits.ljust(8, "_")
+        formatted = f"{d[:2]}/{d[2:4]}/{d[4:]}"
+        last_dob[0], last_dob[1] = digits, formatted
         
         # Update the field
         fields["dob"].set(formatted)
@@ -4420,15 +4747,9 @@ def build_tab(parent):
         
         # Copy button (shown if copy-paste mode is enabled)
         # Determine button text based on display size
-        current_size = ui_settings.get("display_size", "Medium")
-        if current_size == "Small":
-            # Small display: icon only, no text
-            copy_btn_text = "📋"
-            copy_btn_width = 3  # Narrow width for icon only
-        else:
-            # Medium/Large display: icon + text
-            copy_btn_text = "📋 Copy"
-            copy_btn_width = 10
+        copy_btn_text, copy_btn_width = _COPY_BTN_SIZE_CFG.get(
+            ui_settings.get("display_size", "Medium"), _COPY_BTN_DEFAULT_CFG
+        )
         
         copy_btn = ttk.Button(
             r, 
@@ -4442,10 +4763,6 @@ def build_tab(parent):
         if copy_paste_mode_var.get():
             copy_btn.pack(side="right", padx=(5, 0))
         
-        # After widgets are packed, prevent frame from shrinking
-        r.update_idletasks()
-        r.pack_propagate(False)  # Prevent shrinking - keep buttons visible
-        
         if is_dob:
             # Bind key events for DOB formatting
             entry.bind("<KeyRelease>", format_dob_input)
@@ -4461,6 +4778,18 @@ def build_tab(parent):
         else:
             row(fields_frame, label, fields[key], key)
     
+    def freeze_field_rows():
+        """After the rows are laid out, prevent their frames from shrinking - keep buttons visible"""
+        try:
+            fields_frame.update_idletasks()
+            for frame in field_frames.values():
+                frame.pack_propagate(False)
+        except Exception:
+            pass
+    
+    # One deferred layout pass for all rows instead of a flush per row
+    fields_frame.after_idle(freeze_field_rows)
+    
     # Run MVR's button below extracted fields
     def run_mvrs():
         """Run MVR automation for all files - auto-extracts if needed"""
@@ -4561,7 +4890,6 @@ def build_tab(parent):
                         raise  # Re-raise to be caught by outer exception handler
                     # Small delay between files
                     if idx < len(files_to_process):
-                        import time
                         time.sleep(1)
                 
                 set_status(f"Automation complete - processed {len(files_to_process)} file(s)")
@@ -4634,13 +4962,8 @@ def build_tab(parent):
             min_width = max(int(min_width_text), int(base_width * 0.95))  # Increased from 0.9
             
             new_width = max(int(scaled_width), min_width)
+            # The button is marked dirty; the update_button_layout idle pass lays it out
             run_btn.configure(width=new_width)
-            run_btn.update_idletasks()
-            run_btn.update()
-            
-            # Also update the frame to ensure proper layout
-            run_btn_frame.update_idletasks()
-            run_btn_frame.update()
         except Exception:
             pass
     
@@ -4652,6 +4975,26 @@ def build_tab(parent):
             update_run_button_width()
         button_layout_updater_ref[0] = enhanced_updater
     
+    # Debounce display-size relayouts: a burst of requests runs the full updater once,
+    # 50ms after the last request
+    layout_after_id = [None]
+    immediate_layout_updater = button_layout_updater_ref[0]
+    
+    def _run_requested_layout():
+        layout_after_id[0] = None
+        immediate_layout_updater()
+    
+    def request_button_layout():
+        if layout_after_id[0] is not None:
+            try:
+                outer.after_cancel(layout_after_id[0])
+            except Exception:
+                pass
+        layout_after_id[0] = outer.after(50, _run_requested_layout)
+    
+    if immediate_layout_updater is not None:
+        button_layout_updater_ref[0] = request_button_layout
+    
     # Initial width update
     update_run_button_width()
     # After button is packed, prevent frame from shrinking
@@ -4671,11 +5014,38 @@ def build_tab(parent):
             if 0 <= idx < len(pdf_files):
                 current_selected_file = pdf_files[idx]  # Update stored selection
                 return pdf_files[idx]
-        # If no listbox selection, use stored selection
-        if current_selected_file and current_selected_file in pdf_files:
+        # If no listbox selection, use stored selection (set lookup instead of a list scan)
+        if current_selected_file and current_selected_file in pdf_files_set:
             return current_selected_file
         return None
     
+    def parsed_field_updates(parsed):
+        """(key, display value) pairs for the parsed fields shown in the editor"""
+        # Format DOB when setting from extraction
+        return [(k, format_dob_value(v) if k == "dob" else v) for k, v in parsed.items() if k in fields]
+    
+    def load_text(text):
+        """Replace the extracted text view in one bulk insert (Tk main thread only)"""
+        undo = txt.cget("undo")
+        txt.configure(undo=False)
+        try:
+            txt.delete("1.0", "end")
+            txt.insert("1.0", text)
+        finally:
+            txt.configure(undo=undo)
+    
+    def apply_field_updates(updates, save_path=None):
+        """Set field values from a worker's results (Tk main thread only), then save them"""
+        for key, value in updates:
+            fields[key].set(value)
+        if save_path:
+            save_file_data(save_path)
+    
+    # Single persistent worker for extract+parse jobs, so selection changes queue work
+    # instead of spawning a thread each; pending_extract is the latest auto-extract job
+    extract_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mvr-extract")
+    pending_extract = [None]
+    
     def on_extract():
         p = get_selected_file()
         if not p or not os.path.isfile(p):
@@ -4685,24 +5055,16 @@ def build_tab(parent):
             try:
                 set_status("Extracting text...")
                 text = _extract_text_from_pdf(p)
-                txt.delete("1.0", "end")
-                txt.insert("1.0", text)
+                outer.after(0, load_text, text)
                 set_status("Parsing fields...")
                 parsed = _parse_mvr_fields(text)
-                for k, v in parsed.items():
-                    if k in fields:
-                        if k == "dob":
-                            # Format DOB when setting from extraction
-                            fields[k].set(format_dob_value(v))
-                        else:
-                            fields[k].set(v)
-                # Save extracted data
-                save_file_data(p)
+                # Set fields and save extracted data on the Tk main thread in one pass
+                outer.after(0, apply_field_updates, parsed_field_updates(parsed), p)
                 set_status("Ready - Review extracted fields above")
             except Exception as e:
                 set_status("Error")
                 messagebox.showerror("Extraction Error", str(e))
-        threading.Thread(target=work, daemon=True).start()
+        extract_executor.submit(work)
     
     def on_save():
         """Save current field values for the selected file"""
@@ -4727,47 +5089,28 @@ def build_tab(parent):
             return
         
         file_paths = []
+        # Per-drop memo of path -> is an existing PDF, so each candidate is stat'ed once
+        pdf_checks = {}
         
-        # Strategy 1: Handle curly braces format - each file wrapped in {}
-        # Pattern: {C:/path/to/file.pdf} or {C:\path\to\file.pdf}
-        # Split by } { to separate multiple files
-        if "{" in data and "}" in data:
-            # Split by } followed by optional whitespace and {
-            parts = re.split(r'\}\s*\{', data)
-            for part in parts:
-                # Remove leading { and trailing }
-                path = part.strip().strip('{').strip('}').strip()
-                # Normalize forward slashes to backslashes for Windows
-                path = path.replace('/', '\\')
-                if path and os.path.isfile(path) and path.lower().endswith(".pdf"):
-                    if path not in file_paths:
-                        file_paths.append(path)
+        def is_pdf(path):
+            ok = pdf_checks.get(path)
+            if ok is None:
+                ok = pdf_checks[path] = path.lower().endswith(".pdf") and os.path.isfile(path)
+            return ok
         
-        # Strategy 2: If no curly braces, try quoted paths
-        if not file_paths:
-            # Pattern 1: Quoted paths: "C:\path with spaces\file.pdf" or "C:/path/file.pdf"
-            quoted_pattern = r'"([A-Za-z]:[^"]+\.pdf)"'
-            quoted_matches = re.finditer(quoted_pattern, data, re.IGNORECASE)
-            for match in quoted_matches:
-                path = match.group(1).replace('/', '\\')
-                if os.path.isfile(path) and path.lower().endswith(".pdf"):
-                    if path not in file_paths:
-                        file_paths.append(path)
-        
-        # Strategy 3: Unquoted paths (no spaces): C:\path\to\file.pdf or C:/path/file.pdf
-        if not file_paths:
-            unquoted_pattern = r'(?:^|\s)([A-Za-z]:[^\s"]+\.pdf)(?=\s|$)'
-            unquoted_matches = re.finditer(unquoted_pattern, data, re.IGNORECASE)
-            for match in unquoted_matches:
-                path = match.group(1).strip().replace('/', '\\')
-                if os.path.isfile(path) and path.lower().endswith(".pdf"):
-                    if path not in file_paths:
-                        file_paths.append(path)
+        # Single pass over the drop data: {braced path}, "quoted path" or bare C:\path.pdf
+        for match in _DROP_RE.finditer(data):
+            path = (match.group(1) or match.group(2) or match.group(3)).strip()
+            # Normalize forward slashes to backslashes for Windows
+            path = path.replace('/', '\\')
+            # Paths already in pdf_checks were seen earlier in this drop
+            if path not in pdf_checks and is_pdf(path):
+                file_paths.append(path)
         
         # Strategy 4: Try as single file (fallback)
         if not file_paths:
             test_path = data.strip().strip('"').strip('{').strip('}').replace('/', '\\')
-            if os.path.isfile(test_path) and test_path.lower().endswith(".pdf"):
+            if is_pdf(test_path):
                 file_paths.append(test_path)
         
         if file_paths:
@@ -4788,19 +5131,10 @@ def build_tab(parent):
     # Enable drag and drop if available
     if DND_FILES:
         try:
-            # Register on multiple widgets for better coverage
+            # tkdnd walks up from the widget under the cursor to the nearest registered
+            # target, so registering the tab frame covers the list and its children
             outer.drop_target_register(DND_FILES)
             outer.dnd_bind("<<Drop>>", on_drop)
-            file_list_frame.drop_target_register(DND_FILES)
-            file_list_frame.dnd_bind("<<Drop>>", on_drop)
-            list_scroll_frame.drop_target_register(DND_FILES)
-            list_scroll_frame.dnd_bind("<<Drop>>", on_drop)
-            try:
-                pdf_listbox.drop_target_register(DND_FILES)
-                pdf_listbox.dnd_bind("<<Drop>>", on_drop)
-            except Exception:
-                # Listbox might not support drop, that's okay
-                pass
         except Exception as ex:
             # Log but don't fail - drag and drop is optional
             try:
@@ -4847,12 +5181,18 @@ def build_tab(parent):
         threading.Thread(target=work, daemon=True).start()
 
     # Selection handler - auto-load saved data or auto-extract when file is selected
-    def on_listbox_select(e):
-        """Auto-load saved data or auto-extract when a file is selected"""
+    def _do_select():
+        """Auto-load saved data or auto-extract for the selected file"""
+        select_after[0] = None
         p = get_selected_file()
         if not p:
             return
         
+        # Drop a queued auto-extract for a row the user has already moved past
+        if pending_extract[0] is not None:
+            pending_extract[0].cancel()
+            pending_extract[0] = None
+        
         if p in file_data:
             # File has saved data, load it
             load_file_data(p)
@@ -4863,24 +5203,28 @@ def build_tab(parent):
                 try:
                     set_status("Auto-extracting...")
                     text = _extract_text_from_pdf(p)
-                    txt.delete("1.0", "end")
-                    txt.insert("1.0", text)
+                    outer.after(0, load_text, text)
                     set_status("Parsing fields...")
                     parsed = _parse_mvr_fields(text)
-                    for k, v in parsed.items():
-                        if k in fields:
-                            if k == "dob":
-                                # Format DOB when setting from extraction
-                                fields[k].set(format_dob_value(v))
-                            else:
-                                fields[k].set(v)
-                    # Save extracted data
-                    save_file_data(p)
+                    # Set fields and save extracted data on the Tk main thread in one pass
+                    outer.after(0, apply_field_updates, parsed_field_updates(parsed), p)
                     set_status("Auto-extracted and saved")
                 except Exception as e:
                     set_status("Extraction Error")
                     messagebox.showerror("Extraction Error", str(e))
-            threading.Thread(target=work, daemon=True).start()
+            pending_extract[0] = extract_executor.submit(work)
+    
+    # Pending after() id for the debounced selection handler
+    select_after = [None]
+    
+    def on_listbox_select(e):
+        """Auto-load saved data or auto-extract once the selection rests for 150ms"""
+        if select_after[0] is not None:
+            try:
+                outer.after_cancel(select_after[0])
+            except Exception:
+                pass
+        select_after[0] = outer.after(150, _do_select)
     
     pdf_listbox.bind("<<ListboxSelect>>", on_listbox_select)
     
@@ -1,6 +1,8 @@
 ﻿# -*- coding: utf-8 -*-
-import os, io, re, json, hashlib
-from collections import defaultdict
+import os, re, json, hashlib, tempfile, shutil, sqlite3
+from collections import defaultdict, deque, Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinterdnd2 import DND_FILES
@@ -8,9 +10,26 @@ from PIL import Image, ImageTk, ImageOps, ImageFilter
 import fitz  # PyMuPDF
 import pytesseract
 from pytesseract import Output
+try:
+    import orjson  # optional: faster template cache (de)serialization
+except Exception:
+    orjson = None
+try:
+    import mmh3  # optional: faster non-cryptographic cache-key hashing
+except Exception:
+    mmh3 = None
+try:
+    import re2  # optional: linear-time (DFA) matching for rule cues
+except Exception:
+    re2 = None
+try:
+    import tesserocr  # optional: in-process engine, no tesseract launch per call
+except Exception:
+    tesserocr = None
 from datetime import datetime
 from time import perf_counter
 import threading
+import multiprocessing
 
 # ------------------ Paths ------------------
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -25,11 +44,6 @@ _SIZE_PRESETS = {
 }
 _DEFAULT_UI_SETTINGS = {"window_size": "Medium"}
 
-try:
-    from .region_hints import REGION_HINTS as _REGION_HINTS_DATA
-except Exception:
-    _REGION_HINTS_DATA = []
-
 # Region hint measurements use a 0.0–1.1 scale where 1.1 == 11 inches.
 _REGION_SCALE_MAX = 1.1
 
@@ -82,7 +96,19 @@ def _build_region_index(raw):
     return index
 
 
-_REGION_HINTS_INDEX = _build_region_index(_REGION_HINTS_DATA)
+_REGION_HINTS_INDEX = None
+
+
+def _get_region_index():
+    """Region hint index, built on first use (OCR worker processes never need it)."""
+    global _REGION_HINTS_INDEX
+    if _REGION_HINTS_INDEX is None:
+        try:
+            from .region_hints import REGION_HINTS as hints_data
+        except Exception:
+            hints_data = []
+        _REGION_HINTS_INDEX = _build_region_index(hints_data)
+    return _REGION_HINTS_INDEX
 
 # ------------------ Debug ------------------
 DEBUG = False
@@ -91,32 +117,74 @@ def _dbg(msg):
         print(msg)
 
 # ------------------ Globals ------------------
+class _BoundedCache(OrderedDict):
+    """Dict that keeps only the most recently used maxsize entries."""
+
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# Per-session page caches are bounded so very large binders keep a steady footprint;
+# evicted pages are rebuilt from the PDF or the binder's OCR disk cache on demand.
+_TEXT_CACHE_MAX = 256
 _DOC = None
 _ALLOW_OCR = False
-_TEXT_CACHE_RAW = {}
-_TEXT_CACHE_CLEAN = {}
+_TEXT_CACHE_RAW = _BoundedCache(_TEXT_CACHE_MAX)
+_TEXT_CACHE_CLEAN = _BoundedCache(_TEXT_CACHE_MAX)
 _REGION_TEXT_CACHE = {}
 _RANGE_LOOKBACK_HINTS = {}
 _FORCED_OCR_CACHE = set()
 _OCR_PAGE_DPI = {}
 _OCR_PAGE_CONF = {}
-_OCR_RESULT_CACHE = {}
-_OCR_PAGE_SIG = {}
-_PATTERN_HIT_CACHE = {}
-_PATTERN_FIRST_CACHE = {}
-_PATTERN_CACHE_BY_PAGE = defaultdict(set)
+_OCR_RESULT_CACHE = _BoundedCache(_TEXT_CACHE_MAX)
+_OCR_PAGE_SIG = _BoundedCache(_TEXT_CACHE_MAX)
+# Not bounded: several passes walk every page, and an evicted entry means another rawdict parse
+_PAGE_TEXT_PARTS_CACHE = {}
+# page_idx -> (matched bits, evaluated bits): per-rule ints indexed by _cache_id, one bit per (target, cue) slot
+_HIT_ROWS = {}
+_TESS_LOCAL = threading.local()
+_TESS_APIS = []
+_TESS_APIS_LOCK = threading.Lock()
 _CACHE_ROOT = os.path.join(PROJECT_ROOT, "Cache")
 _CACHE_OCR_BINDER = os.path.join(_CACHE_ROOT, "ocr")
 _CACHE_OCR_TEMPLATES = os.path.join(_CACHE_ROOT, "templates")
 _SSA_SETTINGS_PATH = os.path.join(_CACHE_ROOT, "ssa_settings.json")
 _CACHE_BINDER_KEY = None
 _CACHE_BINDER_DIR = None
+_LEGACY_BINDER_KEY_RE = re.compile(r"[0-9a-f]{40}")  # SHA-1 binder keys from before _fast_digest
+_LEGACY_BINDER_CACHES_PURGED = False
+_CACHE_DB = None
+_CACHE_DB_PENDING = {}  # (page, scope) -> row waiting for the next batched write
+_CACHE_DB_FLUSH_EVERY = 25
+_CACHE_DB_LOCK = threading.Lock()
 _CANCELLED = False
 _TEMPLATE_CACHE_VERSION = 1
 _TEMPLATE_CACHE_MAX_PER_RULE = 20
 _TEMPLATE_CACHE_MAX_BYTES = 200 * 1024 * 1024  # ~200 MB
+_TEMPLATE_INDEX_FILE = "_index.idx"  # per-rule token index; not *.json so entry scans skip it
+_TEMPLATE_INDEX_CACHE = {}  # rule_dir -> (index mtime_ns, meta by fingerprint, token -> fingerprints)
+_IMAGE_SIG_MAX_DISTANCE = 3  # differing dHash bits tolerated when the page text also agrees
 _ADAPTIVE_DPI_STEPS = (200, 260, 320, 360)
 _FORCE_OCR_TEXT_THRESHOLD = 80
+# OCR pre-pass threshold: near-white -> white, dark -> black, mid-greys kept
+_BINARIZE_LUT = [255 if p > 200 else (0 if p < 120 else p) for p in range(256)]
 SCAN_MODE_QUICK = "quick"
 SCAN_MODE_ACCURACY = "accuracy"
 _SCAN_MODE = SCAN_MODE_ACCURACY
@@ -146,94 +214,159 @@ def _ensure_dir(path: str):
 
 
 def _clear_pattern_caches():
-    _PATTERN_HIT_CACHE.clear()
-    _PATTERN_FIRST_CACHE.clear()
-    _PATTERN_CACHE_BY_PAGE.clear()
+    _HIT_ROWS.clear()
 
 
 def _invalidate_pattern_cache(page_idx: int):
-    keys = _PATTERN_CACHE_BY_PAGE.pop(page_idx, None)
-    if not keys:
-        return
-    for key in keys:
-        _PATTERN_HIT_CACHE.pop(key, None)
-        _PATTERN_FIRST_CACHE.pop(key, None)
+    _HIT_ROWS.pop(page_idx, None)
 
 
 def _ensure_cache_dirs():
     _ensure_dir(_CACHE_OCR_BINDER)
     _ensure_dir(_CACHE_OCR_TEMPLATES)
+    _purge_legacy_binder_caches()
+
+
+def _purge_legacy_binder_caches():
+    """Once per run, delete binder OCR caches under the old SHA-1 keys; no lookup can reach them now."""
+    global _LEGACY_BINDER_CACHES_PURGED
+    if _LEGACY_BINDER_CACHES_PURGED:
+        return
+    _LEGACY_BINDER_CACHES_PURGED = True
+    try:
+        with os.scandir(_CACHE_OCR_BINDER) as entries:
+            stale = [e.path for e in entries if e.is_dir() and _LEGACY_BINDER_KEY_RE.fullmatch(e.name)]
+    except OSError:
+        return
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _fast_digest(data: bytes) -> str:
+    """128-bit hex digest for cache keys and fingerprints (no cryptographic strength needed)."""
+    if mmh3 is not None:
+        return mmh3.hash_bytes(data, 0x9747b28c).hex()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
 
 
 def _binder_cache_key(pdf_path: str):
     try:
         stat = os.stat(pdf_path)
-        h = hashlib.sha1()
-        h.update(os.path.abspath(pdf_path).lower().encode("utf-8", "ignore"))
-        h.update(str(stat.st_size).encode())
-        h.update(str(getattr(stat, "st_mtime_ns", int(stat.st_mtime * 1e9))).encode())
-        return h.hexdigest()
+        parts = (
+            os.path.abspath(pdf_path).lower().encode("utf-8", "ignore"),
+            str(stat.st_size).encode(),
+            str(getattr(stat, "st_mtime_ns", int(stat.st_mtime * 1e9))).encode(),
+        )
+        return _fast_digest(b"".join(parts))
     except Exception:
         return None
 
 
-def _cache_file_path(page_idx: int, scope: str):
-    if not _CACHE_BINDER_DIR:
-        return None
-    scope = scope or "full"
-    filename = f"{page_idx:05d}_{scope}.json"
-    return os.path.join(_CACHE_BINDER_DIR, filename)
+def _cache_db():
+    """The binder's OCR cache database (one row per page/scope), opened on first use."""
+    global _CACHE_DB
+    if _CACHE_DB is None and _CACHE_BINDER_DIR:
+        try:
+            _ensure_dir(_CACHE_BINDER_DIR)
+            conn = sqlite3.connect(os.path.join(_CACHE_BINDER_DIR, "ocr.db"), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ocr_cache ("
+                "page INTEGER, scope TEXT, raw TEXT, clean TEXT, dpi INTEGER, avg_conf REAL, "
+                "length INTEGER, image_sig TEXT, PRIMARY KEY (page, scope))"
+            )
+            conn.commit()
+            _CACHE_DB = conn
+        except Exception as e:
+            _dbg(f"[Cache] OCR cache database unavailable: {e}")
+            return None
+    return _CACHE_DB
+
+
+def _flush_disk_cache():
+    with _CACHE_DB_LOCK:
+        if not _CACHE_DB_PENDING:
+            return
+        rows = list(_CACHE_DB_PENDING.values())
+        _CACHE_DB_PENDING.clear()
+        conn = _cache_db()
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO ocr_cache "
+                    "(page, scope, raw, clean, dpi, avg_conf, length, image_sig) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except Exception as e:
+            _dbg(f"[Cache] OCR cache write warn: {e}")
+
+
+def _close_disk_cache():
+    global _CACHE_DB
+    _flush_disk_cache()
+    with _CACHE_DB_LOCK:
+        if _CACHE_DB is not None:
+            try:
+                _CACHE_DB.close()
+            except Exception:
+                pass
+        _CACHE_DB = None
 
 
 def _load_disk_cache(page_idx: int, scope: str):
-    path = _cache_file_path(page_idx, scope)
-    if not path or not os.path.exists(path):
+    scope = scope or "full"
+    with _CACHE_DB_LOCK:
+        row = _CACHE_DB_PENDING.get((page_idx, scope))
+        if row is None:
+            conn = _cache_db()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT page, scope, raw, clean, dpi, avg_conf, length, image_sig "
+                    "FROM ocr_cache WHERE page = ? AND scope = ?",
+                    (page_idx, scope),
+                ).fetchone()
+            except Exception:
+                return None
+    if row is None:
         return None
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        if not isinstance(data, dict):
-            return None
-        data.setdefault("scope", scope or "full")
-        if "raw" not in data or "clean" not in data:
-            return None
-        data.setdefault("dpi", 0)
-        data.setdefault("avg_conf", None)
-        data.setdefault("length", len(data.get("clean") or ""))
-        if "image_sig" not in data:
-            data["image_sig"] = None
-        return data
-    except Exception:
+    _, scope, raw, clean, dpi, avg_conf, length, image_sig = row
+    if raw is None or clean is None:
         return None
+    return {
+        "raw": raw,
+        "clean": clean,
+        "dpi": dpi or 0,
+        "avg_conf": avg_conf,
+        "length": length if length is not None else len(clean),
+        "scope": scope,
+        "image_sig": image_sig,
+    }
 
 
 def _save_disk_cache(page_idx: int, scope: str, entry: dict):
-    if not entry:
-        return
-    path = _cache_file_path(page_idx, scope)
-    if not path:
+    if not entry or not _CACHE_BINDER_DIR:
         return
-    tmp = f"{path}.tmp"
-    try:
-        _ensure_dir(os.path.dirname(path))
-        payload = {
-            "raw": entry.get("raw", ""),
-            "clean": entry.get("clean", ""),
-            "dpi": int(entry.get("dpi", 0) or 0),
-            "avg_conf": entry.get("avg_conf"),
-            "length": int(entry.get("length", len(entry.get("clean", "") or "")) or 0),
-            "scope": scope or entry.get("scope") or "full",
-            "image_sig": entry.get("image_sig"),
-        }
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(payload, f)
-        os.replace(tmp, path)
-    except Exception:
-        try:
-            if os.path.exists(tmp):
-                os.remove(tmp)
-        except Exception:
-            pass
+    scope = scope or entry.get("scope") or "full"
+    row = (
+        page_idx,
+        scope,
+        entry.get("raw", ""),
+        entry.get("clean", ""),
+        int(entry.get("dpi", 0) or 0),
+        entry.get("avg_conf"),
+        int(entry.get("length", len(entry.get("clean", "") or "")) or 0),
+        entry.get("image_sig"),
+    )
+    with _CACHE_DB_LOCK:
+        _CACHE_DB_PENDING[(page_idx, scope)] = row
+        pending = len(_CACHE_DB_PENDING)
+    if pending >= _CACHE_DB_FLUSH_EVERY:
+        _flush_disk_cache()
 
 
 def _apply_cached_result(page_idx: int, scope: str, entry: dict):
@@ -260,6 +393,19 @@ def _apply_cached_result(page_idx: int, scope: str, entry: dict):
         _OCR_PAGE_SIG[key] = sig_val
 
 
+def _json_dumps(obj) -> bytes:
+    """Compact UTF-8 JSON for the template cache files."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
 def _template_rule_slug(rule_name: str) -> str:
     if not rule_name:
         return "UNKNOWN"
@@ -277,11 +423,13 @@ def _template_extract_tokens(clean_text: str, limit: int = 60):
     tokens = []
     if not clean_text:
         return tokens
+    seen = set()
     for tok in clean_text.split():
         if len(tok) <= 2:
             continue
-        if tok in tokens:
+        if tok in seen:
             continue
+        seen.add(tok)
         tokens.append(tok)
         if len(tokens) >= limit:
             break
@@ -290,8 +438,8 @@ def _template_extract_tokens(clean_text: str, limit: int = 60):
 
 def _template_load_entry(path: str):
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
     except Exception:
         return None
     if not isinstance(data, dict):
@@ -325,10 +473,85 @@ def _template_collect_entries(rule_name: str):
     return entries
 
 
+def _template_index_meta(entry: dict):
+    """The part of a template entry _template_match scores on."""
+    return {
+        "prefix": entry.get("prefix", ""),
+        "tokens": list(entry.get("tokens") or []),
+        "image_sig": entry.get("image_sig"),
+    }
+
+
+def _template_index_write(rule_dir: str, meta: dict):
+    path = os.path.join(rule_dir, _TEMPLATE_INDEX_FILE)
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_json_dumps({"version": _TEMPLATE_CACHE_VERSION, "entries": meta}))
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except Exception:
+            pass
+    _TEMPLATE_INDEX_CACHE.pop(rule_dir, None)
+
+
+def _template_load_index(rule_name: str):
+    """
+    Return (meta, inverted) for a rule's templates: meta maps fingerprint -> prefix/tokens/image_sig,
+    inverted maps token -> fingerprints. Rebuilt from the entry files when missing or out of step
+    with the directory (e.g. after eviction).
+    """
+    rule_dir = _template_rule_dir(rule_name)
+    if not rule_dir or not os.path.isdir(rule_dir):
+        return None
+    try:
+        on_disk = {fname[:-5] for fname in os.listdir(rule_dir) if fname.lower().endswith(".json")}
+    except Exception:
+        return None
+    index_path = os.path.join(rule_dir, _TEMPLATE_INDEX_FILE)
+    try:
+        mtime = os.stat(index_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    cached = _TEMPLATE_INDEX_CACHE.get(rule_dir)
+    if cached and mtime is not None and cached[0] == mtime and set(cached[1]) == on_disk:
+        return cached[1], cached[2]
+    meta = None
+    if mtime is not None:
+        try:
+            with open(index_path, "rb") as f:
+                data = _json_loads(f.read())
+            if data.get("version") == _TEMPLATE_CACHE_VERSION and set(data.get("entries") or {}) == on_disk:
+                meta = data["entries"]
+        except Exception:
+            meta = None
+    if meta is None:
+        meta = {}
+        for entry in _template_collect_entries(rule_name):
+            fingerprint = os.path.basename(entry["_path"])[:-5]
+            meta[fingerprint] = _template_index_meta(entry)
+        _template_index_write(rule_dir, meta)
+        try:
+            mtime = os.stat(index_path).st_mtime_ns
+        except OSError:
+            mtime = None
+    inverted = defaultdict(list)
+    for fingerprint, info in meta.items():
+        for tok in info.get("tokens") or []:
+            inverted[tok].append(fingerprint)
+    if mtime is not None:
+        _TEMPLATE_INDEX_CACHE[rule_dir] = (mtime, meta, inverted)
+    return meta, inverted
+
+
 def _template_now_iso():
     return datetime.utcnow().isoformat() + "Z"
 
 
+@lru_cache(maxsize=8192)
 def _template_timestamp(value):
     if not value:
         return 0.0
@@ -344,8 +567,8 @@ def _template_write_entry(path: str, data: dict):
     tmp = f"{path}.tmp"
     payload = {k: v for k, v in data.items() if not k.startswith("_")}
     try:
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(payload, f)
+        with open(tmp, "wb") as f:
+            f.write(_json_dumps(payload))
         os.replace(tmp, path)
     except Exception:
         try:
@@ -388,39 +611,50 @@ def _template_match(rule_name: str, seed_text: str, seed_sig: str = None):
     token_seed = set(_template_extract_tokens(clean_seed, limit=50)) if clean_seed else set()
     if not prefix_seed and not token_seed and not seed_sig:
         return None
-    candidates = _template_collect_entries(rule_name)
-    best_entry = None
-    best_score = 0
-    for entry in candidates:
-        prefix = entry.get("prefix", "")
-        tokens = set(entry.get("tokens") or [])
-        score = 0
+    index = _template_load_index(rule_name)
+    if not index:
+        return None
+    meta, inverted = index
+    token_hits = Counter()
+    for tok in token_seed:
+        for fingerprint in inverted.get(tok, ()):
+            token_hits[fingerprint] += 1
+    scored = []
+    for fingerprint, info in meta.items():
+        prefix = info.get("prefix", "")
+        score = token_hits.get(fingerprint, 0)
         if prefix and prefix_seed:
             if prefix.startswith(prefix_seed) or prefix_seed.startswith(prefix):
                 score += 100
-        if token_seed and tokens:
-            score += len(token_seed & tokens)
-        if seed_sig and entry.get("image_sig"):
-            if entry["image_sig"] == seed_sig:
+        if seed_sig and info.get("image_sig"):
+            # Only an identical signature stands on its own; a near one also needs token/prefix agreement
+            if _image_sigs_match(info["image_sig"], seed_sig, near=score > 0):
                 score += 200
-        if score > best_score and score >= 5:
-            best_score = score
-            best_entry = entry
-    if best_entry:
-        _template_mark_usage(best_entry)
-    return best_entry
+        if score >= 5:
+            scored.append((score, fingerprint))
+    # Highest score wins; ties keep index order. Only the winner's file is read.
+    scored.sort(key=lambda item: -item[0])
+    rule_dir = _template_rule_dir(rule_name)
+    for _, fingerprint in scored:
+        best_entry = _template_load_entry(os.path.join(rule_dir, f"{fingerprint}.json"))
+        if best_entry:
+            _template_mark_usage(best_entry)
+            return best_entry
+    return None
 
 
 def _template_evict_rule(rule_name: str):
+    """Trim a rule's templates to _TEMPLATE_CACHE_MAX_PER_RULE; returns the evicted fingerprints."""
+    evicted = set()
     rule_dir = _template_rule_dir(rule_name)
     if not rule_dir or not os.path.isdir(rule_dir):
-        return
+        return evicted
     try:
         entries = _template_collect_entries(rule_name)
     except Exception:
-        return
+        return evicted
     if len(entries) <= _TEMPLATE_CACHE_MAX_PER_RULE:
-        return
+        return evicted
     entries.sort(key=_template_entry_rank)
     while len(entries) > _TEMPLATE_CACHE_MAX_PER_RULE and entries:
         entry = entries.pop(0)
@@ -428,45 +662,65 @@ def _template_evict_rule(rule_name: str):
         try:
             if path and os.path.exists(path):
                 os.remove(path)
+                evicted.add(os.path.basename(path)[:-5])
         except Exception:
             pass
+    return evicted
+
+
+def _template_index_drop(rule_dir: str, fingerprints):
+    """Remove evicted entries from a rule's index file so it keeps matching the directory."""
+    path = os.path.join(rule_dir, _TEMPLATE_INDEX_FILE)
+    try:
+        with open(path, "rb") as f:
+            data = _json_loads(f.read())
+    except Exception:
+        return
+    if data.get("version") != _TEMPLATE_CACHE_VERSION:
+        return
+    meta = {fp: info for fp, info in (data.get("entries") or {}).items() if fp not in fingerprints}
+    _template_index_write(rule_dir, meta)
 
 
 def _template_evict_global():
+    """Trim the template cache to _TEMPLATE_CACHE_MAX_BYTES, least recently written/used first."""
     root = _CACHE_OCR_TEMPLATES
     if not os.path.isdir(root):
         return
-    entries = []
+    items = []  # (mtime, size, path) - filesystem metadata only, no JSON parsing
     total = 0
-    for dirpath, _, filenames in os.walk(root):
-        for fname in filenames:
-            if not fname.lower().endswith(".json"):
-                continue
-            path = os.path.join(dirpath, fname)
-            try:
-                size = os.path.getsize(path)
-            except Exception:
-                size = 0
-            entry = _template_load_entry(path)
-            if not entry:
-                continue
-            entry["_size"] = size
-            total += size
-            entries.append(entry)
+    try:
+        with os.scandir(root) as rule_dirs:
+            for rule_dir in rule_dirs:
+                if not rule_dir.is_dir():
+                    continue
+                with os.scandir(rule_dir.path) as files:
+                    for f in files:
+                        if not f.name.lower().endswith(".json") or not f.is_file():
+                            continue
+                        try:
+                            st = f.stat()
+                        except OSError:
+                            continue
+                        total += st.st_size
+                        items.append((st.st_mtime, st.st_size, f.path))
+    except OSError:
+        return
     if total <= _TEMPLATE_CACHE_MAX_BYTES:
         return
-    entries.sort(key=_template_entry_rank)
-    for entry in entries:
+    items.sort()
+    evicted = defaultdict(set)  # rule dir -> fingerprints
+    for _, size, path in items:
         if total <= _TEMPLATE_CACHE_MAX_BYTES:
             break
-        path = entry.get("_path")
-        size = entry.get("_size", 0)
         try:
-            if path and os.path.exists(path):
-                os.remove(path)
-                total -= size
+            os.remove(path)
+            total -= size
+            evicted[os.path.dirname(path)].add(os.path.basename(path)[:-5])
         except Exception:
             pass
+    for rule_dir, fingerprints in evicted.items():
+        _template_index_drop(rule_dir, fingerprints)
 
 
 def _template_save(rule_name: str, entry: dict, clean_text: str):
@@ -476,7 +730,7 @@ def _template_save(rule_name: str, entry: dict, clean_text: str):
     _ensure_dir(rule_dir)
     prefix = clean_text[:200]
     fingerprint_base = clean_text[:400]
-    fingerprint = hashlib.sha1(fingerprint_base.encode("utf-8", "ignore")).hexdigest()
+    fingerprint = _fast_digest(fingerprint_base.encode("utf-8", "ignore"))
     path = os.path.join(rule_dir, f"{fingerprint}.json")
     existing = _template_load_entry(path)
     created_ts = existing.get("created") if existing else _template_now_iso()
@@ -499,17 +753,54 @@ def _template_save(rule_name: str, entry: dict, clean_text: str):
         "length": int(entry.get("length", len(entry.get("clean", "") or "")) or 0),
         "image_sig": entry.get("image_sig"),
     }
+    index = _template_load_index(rule_name)  # before the write, while it still matches the directory
     _template_write_entry(path, payload)
-    _template_evict_rule(rule_name)
+    evicted = _template_evict_rule(rule_name)
+    if index is not None:
+        # Written after eviction so the index lists exactly the files left on disk
+        meta = {fp: info for fp, info in index[0].items() if fp not in evicted}
+        if os.path.exists(path):
+            meta[fingerprint] = _template_index_meta(payload)
+        _template_index_write(rule_dir, meta)
     _template_evict_global()
 
 
-def _image_signature_from_image(img, size: int = 48) -> str:
+def _pixmap_to_image(pix):
+    """Wrap a PyMuPDF pixmap's raw samples as a PIL image (no PNG encode/decode)."""
+    mode = {1: "L", 3: "RGB", 4: "RGBA"}.get(pix.n, "RGB")
+    return Image.frombytes(mode, (pix.width, pix.height), pix.samples)
+
+
+def _image_signature_from_image(img, hash_size: int = 8):
+    """
+    Difference hash (dHash) of the page image as hex: one bit per horizontally
+    adjacent pixel pair of a (hash_size+1) x hash_size thumbnail. Near-identical
+    scans land a few bits apart (see _image_sigs_match). Returns None for a
+    uniform image, which carries no layout to compare.
+    """
     if img.mode != "L":
         img = img.convert("L")
-    small = img.resize((size, size), Image.BILINEAR)
-    data = small.tobytes()
-    return hashlib.sha1(data).hexdigest()
+    width = hash_size + 1
+    px = img.resize((width, hash_size), Image.BILINEAR).tobytes()
+    bits = 0
+    for row in range(hash_size):
+        base = row * width
+        for col in range(hash_size):
+            bits = (bits << 1) | (px[base + col + 1] > px[base + col])
+    if not bits:
+        return None
+    return f"{bits:0{hash_size * hash_size // 4}x}"
+
+
+def _image_sigs_match(a: str, b: str, near: bool = False) -> bool:
+    if a == b:
+        return True
+    if not near or len(a) != len(b):
+        return False  # signatures from an older cache format only match exactly
+    try:
+        return bin(int(a, 16) ^ int(b, 16)).count("1") <= _IMAGE_SIG_MAX_DISTANCE
+    except ValueError:
+        return False
 
 
 def _page_signature(page_idx: int, scope: str = "full", dpi: int = 160):
@@ -521,8 +812,8 @@ def _page_signature(page_idx: int, scope: str = "full", dpi: int = 160):
         return existing
     try:
         page = _DOC[page_idx]
-        pix = page.get_pixmap(dpi=dpi, alpha=False)
-        img = Image.open(io.BytesIO(pix.tobytes("png"))).convert("L")
+        pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+        img = _pixmap_to_image(pix)
         if scope == "full":
             sig = _image_signature_from_image(img)
         else:
@@ -539,6 +830,7 @@ def begin_text_session(pdf_path: str, allow_ocr: bool):
     if _DOC is not None:
         try: _DOC.close()
         except Exception: pass
+    _close_disk_cache()
     _DOC = fitz.open(pdf_path)
     _ALLOW_OCR = allow_ocr
     _TEXT_CACHE_RAW.clear()
@@ -550,6 +842,7 @@ def begin_text_session(pdf_path: str, allow_ocr: bool):
     _OCR_PAGE_CONF.clear()
     _OCR_RESULT_CACHE.clear()
     _OCR_PAGE_SIG.clear()
+    _PAGE_TEXT_PARTS_CACHE.clear()
     _clear_pattern_caches()
     _CACHE_BINDER_KEY = _binder_cache_key(pdf_path)
     _CACHE_BINDER_DIR = None
@@ -575,6 +868,8 @@ def end_text_session():
         if _DOC is not None: _DOC.close()
     except Exception: pass
     _DOC = None
+    _close_tess_apis()
+    _close_disk_cache()
     _TEXT_CACHE_RAW.clear()
     _TEXT_CACHE_CLEAN.clear()
     _REGION_TEXT_CACHE.clear()
@@ -584,6 +879,8 @@ def end_text_session():
     _OCR_PAGE_CONF.clear()
     _OCR_RESULT_CACHE.clear()
     _OCR_PAGE_SIG.clear()
+    _PAGE_TEXT_PARTS_CACHE.clear()
+    _clean_text.cache_clear()
     _clear_pattern_caches()
     _CACHE_BINDER_KEY = None
     _CACHE_BINDER_DIR = None
@@ -687,35 +984,80 @@ def assess_binder_scan_profile(pdf_path: str, sample_limit: int = 12):
     return allow_ocr, skip_quick, stats
 
 
+_RE_NON_ALNUM = re.compile(r"[^A-Z0-9#+/]+")
+_RE_WS = re.compile(r"\s+")
+
+@lru_cache(maxsize=_TEXT_CACHE_MAX)  # also cleared in end_text_session
 def _clean_text(s: str) -> str:
     if not s: return ""
     s = s.upper().replace("'","'")
-    s = re.sub(r"[^A-Z0-9#+/]+"," ",s)
-    return re.sub(r"\s+"," ",s).strip()
+    s = _RE_NON_ALNUM.sub(" ",s)
+    return _RE_WS.sub(" ",s).strip()
 
-def _page_text_blocks(idx: int) -> str:
-    """Return concatenated text from PyMuPDF text blocks for page idx."""
-    if _DOC is None: return ""
+def _page_text_parts(idx: int):
+    """
+    (text, blocks, words) for page idx from one 'rawdict' parse, reproducing
+    get_text("text"), the joined get_text("blocks") and the sorted get_text("words").
+    """
+    if _DOC is None: return ("", "", "")
+    parts = _PAGE_TEXT_PARTS_CACHE.get(idx)
+    if parts is not None:
+        return parts
     try:
-        blocks = _DOC[idx].get_text("blocks") or []
-        texts = []
-        for b in blocks:
-            t = (b[4] or "").strip()
-            if t:
-                texts.append(t)
-        return "\n".join(texts)
+        # Image blocks are skipped below; without this flag MuPDF decodes every page image into bytes
+        d = _DOC[idx].get_text("rawdict", flags=fitz.TEXTFLAGS_RAWDICT & ~fitz.TEXT_PRESERVE_IMAGES)
     except Exception:
-        return ""
+        return ("", "", "")
+    plain = []
+    blocks = []
+    words = []  # (y0, x0, "word"), split the way get_text("words") splits
+    for b in d.get("blocks", []):
+        if b.get("type", 0) != 0:
+            continue
+        lines = []
+        for line in b["lines"]:
+            line_chars = []
+            chars = []
+            x0 = y0 = None
+            for span in line["spans"]:
+                for c in span["chars"]:
+                    ch = c["c"]
+                    line_chars.append(ch)
+                    if ord(ch) <= 32 or ch == "\xa0":
+                        if chars:
+                            words.append((y0, x0, "".join(chars)))
+                        chars = []
+                        x0 = y0 = None
+                        continue
+                    bx0, by0 = c["bbox"][0], c["bbox"][1]
+                    x0 = bx0 if x0 is None else min(x0, bx0)
+                    y0 = by0 if y0 is None else min(y0, by0)
+                    chars.append(ch)
+            if chars:
+                words.append((y0, x0, "".join(chars)))
+            line_text = "".join(line_chars)
+            lines.append(line_text)
+            if line_text:
+                plain.append(line_text + "\n")
+        t = "\n".join(lines).strip()
+        if t:
+            blocks.append(t)
+    words.sort(key=lambda w: (round(w[0], 1), w[1]))
+    parts = (
+        "".join(plain).strip(),
+        "\n".join(blocks),
+        " ".join(w[2] for w in words if w[2]),
+    )
+    _PAGE_TEXT_PARTS_CACHE[idx] = parts
+    return parts
+
+def _page_text_blocks(idx: int) -> str:
+    """Return concatenated text from PyMuPDF text blocks for page idx."""
+    return _page_text_parts(idx)[1]
 
 def _page_text_words(idx: int) -> str:
     """Return concatenated text from 'words' (sorted left-to-right, top-to-bottom)."""
-    if _DOC is None: return ""
-    try:
-        words = _DOC[idx].get_text("words") or []  # (x0,y0,x1,y1,"word",block,line,word_no)
-        words.sort(key=lambda w: (round(w[1], 1), w[0]))
-        return " ".join(w[4] for w in words if w[4])
-    except Exception:
-        return ""
+    return _page_text_parts(idx)[2]
 
 def _merge_and_clean(*parts: str) -> str:
     raw = " \n ".join(p for p in parts if p)
@@ -775,6 +1117,152 @@ def _update_page_cache(page_idx: int, raw: str):
     _TEXT_CACHE_CLEAN[page_idx] = _clean_text(combined)
     _invalidate_pattern_cache(page_idx)
 
+def _render_ocr_image(i: int, scope: str, pct: float, dpi: int, binarize: bool = True):
+    """Rasterize page i (or its strip/band) at dpi and prepare it for tesseract."""
+    page = _DOC[i]
+    pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+    img = _pixmap_to_image(pix)
+    width, height = img.size
+
+    if scope == "bottom_strip":
+        top = int(height * (1.0 - pct))
+        img = img.crop((0, top, width, height))
+    elif scope == "middle_band":
+        band_h = int(height * pct)
+        top = max(0, (height // 2) - band_h // 2)
+        img = img.crop((0, top, width, min(height, top + band_h)))
+
+    if binarize:
+        img = ImageOps.autocontrast(img)
+        img = img.filter(ImageFilter.MedianFilter(size=3))
+        img = img.point(_BINARIZE_LUT)
+    return img
+
+def _ocr_lines_from_data(data):
+    """Group tesseract image_to_data words into lines; returns (raw, avg_conf)."""
+    words = data.get("text", [])
+    confs = data.get("conf", [])
+    block_nums = data.get("block_num", [])
+    par_nums = data.get("par_num", [])
+    line_nums = data.get("line_num", [])
+
+    groups = defaultdict(list)  # (block, par, line) -> words; dicts keep first-seen (reading) order
+    conf_vals = []
+
+    for idx, word in enumerate(words):
+        w = (word or "").strip()
+        if not w:
+            continue
+        try:
+            conf_val = float(confs[idx])
+        except Exception:
+            conf_val = -1.0
+        if conf_val >= 0:
+            conf_vals.append(conf_val)
+        groups[(
+            block_nums[idx] if idx < len(block_nums) else 0,
+            par_nums[idx] if idx < len(par_nums) else 0,
+            line_nums[idx] if idx < len(line_nums) else 0
+        )].append(w)
+
+    lines = [" ".join(line_words) for line_words in groups.values()]
+    raw = "\n".join(lines).strip()
+    avg_conf = (sum(conf_vals) / len(conf_vals)) if conf_vals else None
+    return raw, avg_conf
+
+def _record_ocr_pass(i: int, scope: str, raw: str, avg_conf, dpi: int, image_sig) -> int:
+    """Merge one OCR pass into the page caches; returns the length used for escalation."""
+    key = (i, scope)
+    _update_page_cache(i, raw)
+    cleaned = _clean_text(raw)
+    combined_clean = _TEXT_CACHE_CLEAN.get(i, cleaned)
+    length_metric = len(combined_clean) if scope == "full" else len(cleaned)
+    _OCR_PAGE_DPI[key] = dpi
+    if avg_conf is not None:
+        _OCR_PAGE_CONF[key] = avg_conf
+    final_raw = _TEXT_CACHE_RAW.get(i, raw)
+    final_clean = _TEXT_CACHE_CLEAN.get(i, combined_clean)
+    _OCR_RESULT_CACHE[key] = {
+        "raw": final_raw,
+        "clean": final_clean,
+        "dpi": dpi,
+        "avg_conf": avg_conf,
+        "length": length_metric,
+        "scope": scope,
+        "image_sig": image_sig,
+    }
+    return length_metric
+
+def _get_tess_api():
+    """This thread's persistent tesserocr engine, or None when tesserocr is unavailable."""
+    if tesserocr is None:
+        return None
+    api = getattr(_TESS_LOCAL, "api", None)
+    if api is not None and api in _TESS_APIS:
+        return api
+    try:
+        api = tesserocr.PyTessBaseAPI(lang="eng", psm=tesserocr.PSM.SINGLE_BLOCK,
+                                      oem=tesserocr.OEM.LSTM_ONLY)
+    except Exception as e:
+        _dbg(f"[OCR] tesserocr unavailable, using pytesseract: {e}")
+        return None
+    _TESS_LOCAL.api = api
+    with _TESS_APIS_LOCK:
+        _TESS_APIS.append(api)
+    return api
+
+def _close_tess_apis():
+    with _TESS_APIS_LOCK:
+        apis = list(_TESS_APIS)
+        _TESS_APIS.clear()
+    for api in apis:
+        try:
+            api.End()
+        except Exception:
+            pass
+
+def _tess_image_to_data(img):
+    """image_to_data-style dict (text/conf/block_num/par_num/line_num) for img."""
+    api = _get_tess_api()
+    if api is None:
+        return pytesseract.image_to_data(
+            img,
+            config="--oem 1 --psm 6 -l eng",
+            output_type=Output.DICT
+        )
+    RIL = tesserocr.RIL
+    data = {"text": [], "conf": [], "block_num": [], "par_num": [], "line_num": []}
+    api.SetImage(img)
+    api.Recognize()
+    it = api.GetIterator()
+    if it is None:
+        return data
+    block = par = line = 0
+    while True:
+        if it.IsAtBeginningOf(RIL.BLOCK):
+            block += 1
+            par = line = 0
+        if it.IsAtBeginningOf(RIL.PARA):
+            par += 1
+            line = 0
+        if it.IsAtBeginningOf(RIL.TEXTLINE):
+            line += 1
+        data["text"].append(it.GetUTF8Text(RIL.WORD) or "")
+        data["conf"].append(it.Confidence(RIL.WORD))
+        data["block_num"].append(block)
+        data["par_num"].append(par)
+        data["line_num"].append(line)
+        if not it.Next(RIL.WORD):
+            break
+    return data
+
+def _tess_image_to_string(img) -> str:
+    api = _get_tess_api()
+    if api is None:
+        return pytesseract.image_to_string(img, config="--oem 1 --psm 6 -l eng")
+    api.SetImage(img)
+    return api.GetUTF8Text() or ""
+
 def _ocr_page_region_into_cache(i: int, region: str = "full", pct: float = 0.35, dpi: int = None, binarize: bool = True):
     """
     OCR page i and update RAW/CLEAN caches with adaptive DPI.
@@ -813,109 +1301,39 @@ def _ocr_page_region_into_cache(i: int, region: str = "full", pct: float = 0.35,
                 _OCR_PAGE_CONF[key] = cached_conf
             return
         target_dpi = max(target_dpi, cached_dpi)
+    if scope == "full":
+        # A page whose own text layer already reads well needs no rasterizing
+        native_clean = _clean_text(_page_text_blocks(i))
+        if len(native_clean) >= _scope_quality_threshold(scope):
+            # Recorded as a dpi-0 pass so later calls stop at the result-cache check above;
+            # it is not written to the disk cache since the PDF itself is the source.
+            _record_ocr_pass(i, scope, _native_page_text(i), 100.0, 0, None)
+            return
     pct = max(0.05, min(0.95, float(pct)))
     current_dpi = max(target_dpi, _OCR_PAGE_DPI.get(key, target_dpi))
-    image_sig = None
+    # The page layout does not change between DPI steps, so one signature serves every pass
+    image_sig = _OCR_PAGE_SIG.get(key) if scope == "full" else None
 
     while True:
         if _CANCELLED:
             break
         avg_conf = None
         try:
-            page = _DOC[i]
-            pix = page.get_pixmap(dpi=current_dpi, alpha=False)
-            img = Image.open(io.BytesIO(pix.tobytes("png"))).convert("L")
-            width, height = img.size
-
-            if scope == "bottom_strip":
-                top = int(height * (1.0 - pct))
-                img = img.crop((0, top, width, height))
-            elif scope == "middle_band":
-                band_h = int(height * pct)
-                top = max(0, (height // 2) - band_h // 2)
-                img = img.crop((0, top, width, min(height, top + band_h)))
-
-            if binarize:
-                img = ImageOps.autocontrast(img)
-                img = img.filter(ImageFilter.MedianFilter(size=3))
-                img = img.point(lambda p: 255 if p > 200 else (0 if p < 120 else p))
-            if scope == "full":
+            img = _render_ocr_image(i, scope, pct, current_dpi, binarize)
+            if scope == "full" and image_sig is None:
                 try:
                     image_sig = _image_signature_from_image(img)
                 except Exception:
                     image_sig = None
 
-            data = pytesseract.image_to_data(
-                img,
-                config="--oem 1 --psm 6 -l eng",
-                output_type=Output.DICT
-            )
-
-            words = data.get("text", [])
-            confs = data.get("conf", [])
-            block_nums = data.get("block_num", [])
-            par_nums = data.get("par_num", [])
-            line_nums = data.get("line_num", [])
-
-            lines = []
-            current_line = []
-            current_key = None
-            conf_vals = []
-
-            for idx, word in enumerate(words):
-                w = (word or "").strip()
-                if not w:
-                    continue
-                try:
-                    conf_val = float(confs[idx])
-                except Exception:
-                    conf_val = -1.0
-                if conf_val >= 0:
-                    conf_vals.append(conf_val)
-                key_tuple = (
-                    block_nums[idx] if idx < len(block_nums) else 0,
-                    par_nums[idx] if idx < len(par_nums) else 0,
-                    line_nums[idx] if idx < len(line_nums) else 0
-                )
-                if current_key is None:
-                    current_key = key_tuple
-                    current_line = [w]
-                elif key_tuple != current_key:
-                    if current_line:
-                        lines.append(" ".join(current_line))
-                    current_line = [w]
-                    current_key = key_tuple
-                else:
-                    current_line.append(w)
-
-            if current_line:
-                lines.append(" ".join(current_line))
-
-            raw = "\n".join(lines).strip()
-            avg_conf = (sum(conf_vals) / len(conf_vals)) if conf_vals else None
+            data = _tess_image_to_data(img)
+            raw, avg_conf = _ocr_lines_from_data(data)
         except Exception as e:
             _dbg(f"OCR (region={scope}) warn p{i+1}: {e}")
             raw = ""
             avg_conf = None
 
-        _update_page_cache(i, raw)
-        cleaned = _clean_text(raw)
-        combined_clean = _TEXT_CACHE_CLEAN.get(i, cleaned)
-        length_metric = len(combined_clean) if scope == "full" else len(cleaned)
-        _OCR_PAGE_DPI[key] = current_dpi
-        if avg_conf is not None:
-            _OCR_PAGE_CONF[key] = avg_conf
-        final_raw = _TEXT_CACHE_RAW.get(i, raw)
-        final_clean = _TEXT_CACHE_CLEAN.get(i, combined_clean)
-        _OCR_RESULT_CACHE[key] = {
-            "raw": final_raw,
-            "clean": final_clean,
-            "dpi": current_dpi,
-            "avg_conf": avg_conf,
-            "length": length_metric,
-            "scope": scope,
-            "image_sig": image_sig,
-        }
+        length_metric = _record_ocr_pass(i, scope, raw, avg_conf, current_dpi, image_sig)
 
         if not _needs_escalation(scope, length_metric, avg_conf, current_dpi):
             break
@@ -935,6 +1353,360 @@ def _ocr_page_region_into_cache(i: int, region: str = "full", pct: float = 0.35,
             final_entry["image_sig"] = image_sig
         _save_disk_cache(i, scope, final_entry)
 
+# ------------------ Batched OCR ------------------
+def _render_first_pass(i: int, scope: str, pct: float, dpi, binarize: bool):
+    """Render page i at its starting DPI for a multi-page OCR pass; returns (dpi, image, image_sig)."""
+    target_dpi = _select_initial_dpi(i, scope, requested=dpi)
+    page_dpi = max(target_dpi, _OCR_PAGE_DPI.get((i, scope), target_dpi))
+    img = _render_ocr_image(i, scope, pct, page_dpi, binarize)
+    image_sig = _OCR_PAGE_SIG.get((i, scope)) if scope == "full" else None
+    if scope == "full" and image_sig is None:
+        try:
+            image_sig = _image_signature_from_image(img)
+        except Exception:
+            image_sig = None
+    return page_dpi, img, image_sig
+
+
+def _finish_first_pass(i: int, scope: str, pct: float, binarize: bool, raw: str, avg_conf, page_dpi: int, image_sig):
+    """Record a multi-page pass result for page i, escalating DPI exactly as the per-page loop would."""
+    length_metric = _record_ocr_pass(i, scope, raw, avg_conf, page_dpi, image_sig)
+    next_dpi = _next_dpi(page_dpi)
+    if _needs_escalation(scope, length_metric, avg_conf, page_dpi) and next_dpi > page_dpi:
+        # Continue the adaptive DPI ladder for this page on its own
+        _ocr_page_region_into_cache(i, region=scope, pct=pct, dpi=next_dpi, binarize=binarize)
+    else:
+        _save_disk_cache(i, scope, _OCR_RESULT_CACHE[(i, scope)])
+
+
+def _split_batch_data(data):
+    """Split image_to_data output for an image list into one dict per image."""
+    levels = data.get("level", [])
+    page_nums = data.get("page_num", [])
+    columns = [k for k, v in data.items() if isinstance(v, list)]
+    slices = []
+    prev_page = None
+    for idx in range(len(data.get("text", []))):
+        page_num = page_nums[idx] if idx < len(page_nums) else None
+        # Each image opens with a level-1 (page) row; page_num may or may not advance
+        starts_page = (idx < len(levels) and levels[idx] == 1) or page_num != prev_page
+        if starts_page or not slices:
+            slices.append({k: [] for k in columns})
+        prev_page = page_num
+        for k in columns:
+            col = data[k]
+            slices[-1][k].append(col[idx] if idx < len(col) else None)
+    return slices
+
+
+def _ocr_batch(indices, scope: str = "full", pct: float = 0.9, dpi: int = None, binarize: bool = True):
+    """
+    OCR several pages with a single tesseract run over an image-list file, so the
+    engine and language data load once instead of once per page.
+    Pages that still need a higher DPI finish through _ocr_page_region_into_cache.
+    Returns the pages that were handled; anything else is left to the serial path.
+    """
+    if _DOC is None or not _ALLOW_OCR or _CANCELLED:
+        return []
+    scope = scope or "full"
+    todo = [i for i in indices
+            if (i, scope) not in _OCR_RESULT_CACHE and not _load_disk_cache(i, scope)]
+    if len(todo) < 2 or _get_tess_api() is not None:
+        # Nothing to amortize when the engine already stays loaded in-process
+        return []
+    pct = max(0.05, min(0.95, float(pct)))
+    tmp_dir = tempfile.mkdtemp(prefix="bindocs_ocr_")
+    rendered = []  # (page, dpi, image_sig)
+    try:
+        paths = []
+        for i in todo:
+            if _CANCELLED:
+                return []
+            page_dpi, img, image_sig = _render_first_pass(i, scope, pct, dpi, binarize)
+            path = os.path.join(tmp_dir, f"page_{i}.png")
+            img.save(path)
+            paths.append(path)
+            rendered.append((i, page_dpi, image_sig))
+        list_path = os.path.join(tmp_dir, "images.txt")
+        with open(list_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(paths) + "\n")
+        data = pytesseract.image_to_data(
+            list_path,
+            config="--oem 1 --psm 6 -l eng",
+            output_type=Output.DICT
+        )
+        slices = _split_batch_data(data)
+    except Exception as e:
+        _dbg(f"[OCR] Batch OCR unavailable, using per-page OCR: {e}")
+        return []
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    if len(slices) != len(rendered):
+        _dbg(f"[OCR] Batch OCR returned {len(slices)} pages for {len(rendered)} images; using per-page OCR")
+        return []
+
+    done = []
+    for (i, page_dpi, image_sig), page_data in zip(rendered, slices):
+        if _CANCELLED:
+            break
+        raw, avg_conf = _ocr_lines_from_data(page_data)
+        _finish_first_pass(i, scope, pct, binarize, raw, avg_conf, page_dpi, image_sig)
+        done.append(i)
+    return done
+
+# ------------------ Prefetched OCR ------------------
+_PREFETCH_DEPTH = 2  # pages rendered ahead of the one being recognised
+
+
+def ocr_pages_prefetched(indices, scope: str = "full", pct: float = 0.9, dpi: int = None, binarize: bool = True):
+    """
+    OCR pages in order while the next page is already being rasterized: one background
+    thread runs the OCR engine (which releases the GIL) on page i as this thread renders
+    page i+1. PyMuPDF and the page caches are only ever touched from the calling thread.
+    Returns the pages that were handled; anything else is left to the serial path.
+    """
+    if _DOC is None or not _ALLOW_OCR or _CANCELLED:
+        return []
+    scope = scope or "full"
+    todo = [i for i in indices
+            if (i, scope) not in _OCR_RESULT_CACHE and not _load_disk_cache(i, scope)]
+    if len(todo) < 2:
+        return []
+    pct = max(0.05, min(0.95, float(pct)))
+    done = []
+    in_flight = deque()  # (page, dpi, image_sig, future)
+
+    def finish_oldest():
+        i, page_dpi, image_sig, fut = in_flight.popleft()
+        try:
+            raw, avg_conf = _ocr_lines_from_data(fut.result())
+        except Exception as e:
+            _dbg(f"OCR (region={scope}) warn p{i+1}: {e}")
+            return
+        _finish_first_pass(i, scope, pct, binarize, raw, avg_conf, page_dpi, image_sig)
+        done.append(i)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr-prefetch") as executor:
+        for i in todo:
+            if _CANCELLED:
+                break
+            try:
+                page_dpi, img, image_sig = _render_first_pass(i, scope, pct, dpi, binarize)
+            except Exception as e:
+                _dbg(f"OCR (region={scope}) render warn p{i+1}: {e}")
+                continue
+            in_flight.append((i, page_dpi, image_sig, executor.submit(_tess_image_to_data, img)))
+            if len(in_flight) >= _PREFETCH_DEPTH:
+                finish_oldest()
+        while in_flight and not _CANCELLED:
+            finish_oldest()
+    return done
+
+# ------------------ Parallel OCR ------------------
+def _ocr_pool_size() -> int:
+    workers = max(1, (os.cpu_count() or 1) - 1)
+    if _SCAN_MODE == SCAN_MODE_QUICK:
+        workers = max(1, workers // 2)
+    return workers
+
+
+def _shutdown_pool(executor, futures):
+    """Shut a worker pool down; on cancel, drop queued work instead of waiting for it."""
+    if _CANCELLED:
+        # Future.cancel rather than shutdown(cancel_futures=True), which needs Python 3.9
+        for fut in futures:
+            fut.cancel()
+    executor.shutdown(wait=not _CANCELLED)
+
+
+def _ocr_worker_init(pdf_path: str, allow_ocr: bool):
+    """Worker process setup: its own document handle (PyMuPDF objects are not fork-safe)."""
+    global _DOC, _ALLOW_OCR, _CACHE_BINDER_DIR
+    # One tesseract thread per worker - the pool already uses every core
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    _DOC = fitz.open(pdf_path)
+    _ALLOW_OCR = allow_ocr
+    _CACHE_BINDER_DIR = None  # the parent process owns the disk cache
+
+
+def _ocr_worker_task(i: int, scope: str, pct: float, dpi, existing_raw: str):
+    """OCR one page in a worker and return (page, result cache entry)."""
+    _TEXT_CACHE_RAW.clear()
+    _TEXT_CACHE_CLEAN.clear()
+    _OCR_RESULT_CACHE.clear()
+    _OCR_PAGE_DPI.clear()
+    _OCR_PAGE_CONF.clear()
+    _OCR_PAGE_SIG.clear()
+    if existing_raw:
+        _TEXT_CACHE_RAW[i] = existing_raw
+    _ocr_page_region_into_cache(i, region=scope, pct=pct, dpi=dpi, binarize=True)
+    return i, _OCR_RESULT_CACHE.get((i, scope))
+
+
+def ocr_pages_parallel(indices, scope: str = "full", pct: float = 0.9, dpi: int = None):
+    """
+    OCR several pages across worker processes and merge the results into this
+    session's caches, exactly as _ocr_page_region_into_cache would have.
+    Returns the pages that were handled; anything else is left to the serial path.
+    """
+    if _DOC is None or not _ALLOW_OCR or _CANCELLED:
+        return []
+    scope = scope or "full"
+    todo = [i for i in indices
+            if (i, scope) not in _OCR_RESULT_CACHE and not _load_disk_cache(i, scope)]
+    workers = min(_ocr_pool_size(), len(todo))
+    if workers < 2:
+        return []
+    try:
+        # spawn, not fork: the parent holds an open document and the Tk thread
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_ocr_worker_init, initargs=(_DOC.name, _ALLOW_OCR))
+    except Exception as e:
+        _dbg(f"[OCR] Parallel pool unavailable, using serial OCR: {e}")
+        return []
+    done = []
+    futures = []
+    try:
+        futures = [executor.submit(_ocr_worker_task, i, scope, pct, dpi, _TEXT_CACHE_RAW.get(i, ""))
+                   for i in todo]
+        for fut in as_completed(futures):
+            if _CANCELLED:
+                break
+            try:
+                i, entry = fut.result()
+            except Exception as e:
+                _dbg(f"[OCR] Parallel worker warn: {e}")
+                continue
+            if not entry:
+                continue
+            _apply_cached_result(i, scope, entry)
+            # A live OCR pass keeps its signature in the result entry only (see _ocr_page_region_into_cache)
+            _OCR_PAGE_SIG.pop((i, scope), None)
+            _save_disk_cache(i, scope, entry)
+            done.append(i)
+    finally:
+        _shutdown_pool(executor, futures)
+    return done
+
+
+def _ocr_thin_pages_parallel(indices):
+    """Batch-OCR the pages page_text would send to OCR one by one."""
+    if not _ALLOW_OCR or _DOC is None:
+        return
+    thin = [i for i in indices
+            if i not in _TEXT_CACHE_RAW and _native_text_is_thin(_native_page_text(i))]
+    handled = set(ocr_pages_parallel(thin, "full", pct=0.9, dpi=None))
+    handled.update(_ocr_batch([i for i in thin if i not in handled], "full", pct=0.9, dpi=None))
+    ocr_pages_prefetched([i for i in thin if i not in handled], "full", pct=0.9, dpi=None)
+
+
+# ------------------ Parallel cue matching ------------------
+_PARALLEL_HITS_MIN_PAGES = 100  # smaller binders scan faster serially than a spawn pool starts up
+_HITS_WORKER_CUES = None
+
+
+def _hits_cue_table(rules):
+    """(rule, target, shift, cue list) for every cue list without region hints."""
+    table = []
+    for rule in rules:
+        hints = rule.get("_region_hints") or {}
+        for target, (lst, _, shift) in (rule.get("_hit_slots") or {}).items():
+            if not hints.get(target):
+                table.append((rule, target, shift, lst))
+    return table
+
+
+def _hits_worker_init(cue_table):
+    """Worker process setup: compile the cue lists once (compiled patterns are not shipped across)."""
+    global _HITS_WORKER_CUES
+    _HITS_WORKER_CUES = [(rid, shift, [_compile_cue(p) for p in patterns])
+                         for rid, shift, patterns in cue_table]
+
+
+def _hits_worker_task(chunk):
+    """Return (page, [(rid, matched bits, evaluated bits)]) for each (page, cleaned text, cue list indexes) in chunk."""
+    out = []
+    for page_idx, text, wanted in chunk:
+        rows = []
+        for n in wanted:
+            rid, shift, pats = _HITS_WORKER_CUES[n]
+            found = 0
+            for k, pat in enumerate(pats):
+                if pat.search(text):
+                    found |= 1 << (shift + k)
+            rows.append((rid, found, ((1 << len(pats)) - 1) << shift))
+        out.append((page_idx, rows))
+    return out
+
+
+def _precompute_hits_parallel(rules, cleaned_texts):
+    """
+    Seed _HIT_ROWS for every page before the sequential match loop. The fused
+    pre-screen runs here and rules out most cue lists; whatever survives is
+    matched across worker processes, unless so little is left that the serial
+    loop is cheaper. Cue lists with region hints need the document and stay serial.
+    """
+    if _DOC is None or _CANCELLED or len(_DOC) < _PARALLEL_HITS_MIN_PAGES or (os.cpu_count() or 1) <= 2:
+        return
+    table = _hits_cue_table(rules)
+    if not table:
+        return
+    pages = []
+    remaining = 0
+    for page_idx, text in enumerate(cleaned_texts):
+        wanted = []
+        for n, (rule, target, shift, lst) in enumerate(table):
+            fused = _fused_cue(rule, target, lst)
+            if fused is not None and not fused.search(text):
+                rid = rule["_cache_id"]
+                _hit_rows(page_idx, rid)[1][rid] |= ((1 << len(lst)) - 1) << shift
+            else:
+                wanted.append(n)
+        if wanted:
+            pages.append((page_idx, text, wanted))
+            remaining += len(wanted)
+    if remaining * 2 < len(table) * len(cleaned_texts):
+        return
+    workers = _ocr_pool_size()
+    step = max(1, -(-len(pages) // (workers * 4)))
+    chunks = [pages[k:k + step] for k in range(0, len(pages), step)]
+    cue_table = [(rule["_cache_id"], shift, [p.pattern for p in lst]) for rule, _, shift, lst in table]
+    try:
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_hits_worker_init, initargs=(cue_table,))
+    except Exception as e:
+        _dbg(f"[Match] Parallel pool unavailable, matching serially: {e}")
+        return
+    futures = []
+    try:
+        futures = [executor.submit(_hits_worker_task, chunk) for chunk in chunks]
+        for fut in as_completed(futures):
+            if _CANCELLED:
+                break
+            try:
+                results = fut.result()
+            except Exception as e:
+                _dbg(f"[Match] Parallel worker warn: {e}")
+                continue
+            for page_idx, rows in results:
+                for rid, found, done in rows:
+                    matched_row, done_row = _hit_rows(page_idx, rid)
+                    matched_row[rid] |= found
+                    done_row[rid] |= done
+    finally:
+        _shutdown_pool(executor, futures)
+
+
+def _native_page_text(page_index: int) -> str:
+    """Native 'text' plus table-friendly 'blocks' and 'words' for a page."""
+    raw_text, blocks_text, words_text = _page_text_parts(page_index)
+    return "\n".join(t for t in (raw_text, blocks_text, words_text) if t)
+
+
+def _native_text_is_thin(merged: str) -> bool:
+    return not merged or len(_clean_text(merged)) < 100
+
+
 def page_text(pdf_path, page_index):
     """
     Populate RAW cache with best-effort text:
@@ -946,21 +1718,10 @@ def page_text(pdf_path, page_index):
     if page_index in _TEXT_CACHE_RAW:
         return _TEXT_CACHE_RAW[page_index]
 
-    raw_text = ""
-    blocks_text = ""
-    words_text = ""
-    if _DOC:
-        try:
-            raw_text = (_DOC[page_index].get_text("text") or "").strip()
-        except Exception:
-            raw_text = ""
-        blocks_text = _page_text_blocks(page_index)
-        words_text  = _page_text_words(page_index)
-
-    merged = "\n".join(t for t in (raw_text, blocks_text, words_text) if t)
+    merged = _native_page_text(page_index)
 
     # Escalate to OCR only if permitted and merged text is thin
-    if (not merged or len(_clean_text(merged)) < 100) and _ALLOW_OCR and _DOC:
+    if _native_text_is_thin(merged) and _ALLOW_OCR and _DOC:
         try:
             _ocr_page_region_into_cache(page_index, region="full", pct=0.9, dpi=None, binarize=True)
             merged = _TEXT_CACHE_RAW.get(page_index, merged)
@@ -982,7 +1743,7 @@ def _suspect_pages():
     if _DOC is None: return []
     suspects = []
     for i in range(len(_DOC)):
-        t = (_DOC[i].get_text("text") or "").strip()
+        t = _page_text_parts(i)[0]
         if len(t) < 100:
             suspects.append(i)
     return suspects
@@ -1026,10 +1787,10 @@ def _get_region_clean(page_idx: int, start_frac: float, end_frac: float) -> str:
                 text = " ".join(w[4] for w in words if w[4])
         if not text and _ALLOW_OCR:
             try:
-                pix = page.get_pixmap(clip=clip, dpi=300, alpha=False)
-                img = Image.open(io.BytesIO(pix.tobytes("png"))).convert("L")
+                pix = page.get_pixmap(clip=clip, dpi=300, colorspace=fitz.csGRAY, alpha=False)
+                img = _pixmap_to_image(pix)
                 img = ImageOps.autocontrast(img)
-                text = pytesseract.image_to_string(img, config="--oem 1 --psm 6 -l eng")
+                text = _tess_image_to_string(img)
             except Exception as e:
                 _dbg(f"OCR region warn p{page_idx+1}: {e}")
                 text = ""
@@ -1058,7 +1819,7 @@ def _resolve_pattern_list(rule: dict, target: str):
 
 
 def _attach_region_hints(rule: dict):
-    hints = _REGION_HINTS_INDEX.get(rule.get("name"))
+    hints = _get_region_index().get(rule.get("name"))
     if not hints:
         return
     store = rule.setdefault("_region_hints", {})
@@ -1066,72 +1827,166 @@ def _attach_region_hints(rule: dict):
         compiled_list = _resolve_pattern_list(rule, target)
         if not compiled_list:
             continue
+        by_text = defaultdict(list)
+        for compiled in compiled_list:
+            by_text[compiled.pattern].append(compiled)
         target_store = store.setdefault(target, {})
         for entry in entries:
-            pattern_text = entry["pattern"]
             bands = [tuple(b) for b in entry["bands"]]
-            for compiled in compiled_list:
-                if compiled.pattern == pattern_text:
-                    target_store[compiled] = bands
+            for compiled in by_text.get(entry["pattern"], ()):
+                target_store[compiled] = bands
 
 
-def _pattern_hits(rule: dict, target: str, patterns, page_idx: int, cleaned_texts, pdf_path: str = None) -> int:
-    if not patterns:
-        return 0
-    rid = rule.get("_cache_id")
-    if rid is None:
-        rid = id(rule)
-    cache_key = (rid, target, page_idx)
-    cached = _PATTERN_HIT_CACHE.get(cache_key)
-    if cached is not None:
-        return cached
+def _hit_rows(page_idx: int, rid: int):
+    rows = _HIT_ROWS.get(page_idx)
+    if rows is None:
+        rows = _HIT_ROWS[page_idx] = ([], [])
+    grow = rid + 1 - len(rows[0])
+    if grow > 0:
+        rows[0].extend([0] * grow)
+        rows[1].extend([0] * grow)
+    return rows
+
+
+def _cue_slot(rule: dict, target: str, patterns):
+    slot = (rule.get("_hit_slots") or {}).get(target)
+    if slot and slot[0] is patterns:
+        return slot
+    return None
+
+
+def _cue_matches(pat, hint_map, page_idx: int, cleaned_text: str) -> bool:
+    if hint_map and pat in hint_map:
+        for band in hint_map[pat]:
+            region_text = _get_region_clean(page_idx, band[0], band[1])
+            if region_text and pat.search(region_text):
+                return True
+    return bool(pat.search(cleaned_text))
+
+
+def _scan_cues(rule: dict, target: str, patterns, page_idx: int, cleaned_texts, first_only: bool = False) -> int:
+    """Bitmask of matching cues (bit k = patterns[k]) on a page, memoised in _HIT_ROWS.
+
+    With first_only the scan stops at the first matching cue; later cues stay unevaluated
+    and are picked up by a later full scan.
+    """
+    full = (1 << len(patterns)) - 1
+    slot = _cue_slot(rule, target, patterns)
+    found = done = 0
+    if slot is not None:
+        _, rid, shift = slot
+        matched_row, done_row = _hit_rows(page_idx, rid)
+        found = (matched_row[rid] >> shift) & full
+        done = (done_row[rid] >> shift) & full
+        if done == full:
+            return found
     cleaned_text = cleaned_texts[page_idx]
-    total = 0
     hint_map = (rule.get("_region_hints") or {}).get(target)
-    for pat in patterns:
-        matched = False
-        if hint_map and pat in hint_map:
-            for band in hint_map[pat]:
-                region_text = _get_region_clean(page_idx, band[0], band[1])
-                if region_text and pat.search(region_text):
-                    matched = True
-                    total += 1
+    fused = None if (hint_map or done) else _fused_cue(rule, target, patterns)
+    if fused is not None and not fused.search(cleaned_text):
+        done = full
+    else:
+        for k, pat in enumerate(patterns):
+            bit = 1 << k
+            if done & bit:
+                if first_only and found & bit:
+                    break
+                continue
+            done |= bit
+            if _cue_matches(pat, hint_map, page_idx, cleaned_text):
+                found |= bit
+                if first_only:
                     break
-        if not matched and pat.search(cleaned_text):
-            total += 1
-    _PATTERN_HIT_CACHE[cache_key] = total
-    _PATTERN_CACHE_BY_PAGE[page_idx].add(cache_key)
-    return total
+    if slot is not None:
+        matched_row[rid] |= found << shift
+        done_row[rid] |= done << shift
+    return found
+
+
+def _pattern_hits(rule: dict, target: str, patterns, page_idx: int, cleaned_texts, pdf_path: str = None) -> int:
+    if not patterns:
+        return 0
+    return bin(_scan_cues(rule, target, patterns, page_idx, cleaned_texts)).count("1")  # int.bit_count is 3.10+
 
 
 def _pattern_first_match(rule: dict, target: str, patterns, page_idx: int, cleaned_texts, pdf_path: str = None):
     if not patterns:
         return None
-    rid = rule.get("_cache_id")
-    if rid is None:
-        rid = id(rule)
-    cache_key = (rid, ("first", target), page_idx)
-    if cache_key in _PATTERN_FIRST_CACHE:
-        return _PATTERN_FIRST_CACHE[cache_key]
-    cleaned_text = cleaned_texts[page_idx]
-    hint_map = (rule.get("_region_hints") or {}).get(target)
-    for pat in patterns:
-        if hint_map and pat in hint_map:
-            for band in hint_map[pat]:
-                region_text = _get_region_clean(page_idx, band[0], band[1])
-                if region_text and pat.search(region_text):
-                    _PATTERN_FIRST_CACHE[cache_key] = pat
-                    _PATTERN_CACHE_BY_PAGE[page_idx].add(cache_key)
-                    return pat
-        if pat.search(cleaned_text):
-            _PATTERN_FIRST_CACHE[cache_key] = pat
-            _PATTERN_CACHE_BY_PAGE[page_idx].add(cache_key)
-            return pat
-    _PATTERN_FIRST_CACHE[cache_key] = None
-    _PATTERN_CACHE_BY_PAGE[page_idx].add(cache_key)
-    return None
+    found = _scan_cues(rule, target, patterns, page_idx, cleaned_texts, first_only=True)
+    if not found:
+        return None
+    return patterns[(found & -found).bit_length() - 1]
 
 # ------------------ Rules ------------------
+_RE2_UNSUPPORTED = re.compile(r"\(\?(?:=|!|<=|<!)|\\[1-9]")  # lookarounds / backreferences
+_LEADING_FLAGS_RE = re.compile(r"^\(\?([imsx]+)\)")
+_CUE_TARGETS = (
+    "require_any", "helpful_cues", "forbid_any",
+    "start.any_cues", "start.next_page_hits", "start.fallback_cues", "start.lookback_prev_forbid",
+    "end.first_cue",
+)
+
+
+def _compile_cue(pattern: str):
+    """Compile a cue with re2 when installed and the pattern is RE2-compatible, else with re."""
+    if re2 is not None and not _RE2_UNSUPPORTED.search(pattern):
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass
+    return re.compile(pattern)
+
+
+def _fuse_cues(compiled_list):
+    """One alternation over a cue list, for a single 'does any cue match?' scan. None if it can't be built."""
+    parts = []
+    for pat in compiled_list:
+        text = pat.pattern
+        m = _LEADING_FLAGS_RE.match(text)
+        if m:
+            # Leading global flags (e.g. "(?s)") become scoped so they can sit inside the alternation
+            text = f"(?{m.group(1)}:{text[m.end():]})"
+        parts.append(f"(?:{text})")
+    if len(parts) < 2:
+        return None
+    try:
+        return _compile_cue("|".join(parts))
+    except Exception:
+        return None
+
+
+def _attach_fused_cues(rule: dict):
+    store = {}
+    for target in _CUE_TARGETS:
+        lst = _resolve_pattern_list(rule, target)
+        if not lst:
+            continue
+        fused = _fuse_cues(lst)
+        if fused is not None:
+            store[target] = (lst, fused)
+    rule["_fused"] = store
+
+
+def _assign_hit_slots(rule: dict):
+    """Give each (target, cue) of a rule its own bit in the rule's _HIT_ROWS entries."""
+    slots = {}
+    shift = 0
+    for target in _CUE_TARGETS:
+        lst = _resolve_pattern_list(rule, target)
+        if not lst:
+            continue
+        slots[target] = (lst, rule["_cache_id"], shift)
+        shift += len(lst)
+    rule["_hit_slots"] = slots
+
+
+def _fused_cue(rule: dict, target: str, patterns):
+    entry = (rule.get("_fused") or {}).get(target)
+    if entry and entry[0] is patterns:
+        return entry[1]
+    return None
+
+
 def load_rules(path=RULES_PATH):
     with open(path,"r",encoding="utf-8") as f:
         rules = json.load(f)
@@ -1141,7 +1996,7 @@ def load_rules(path=RULES_PATH):
     # Always filter: keep non-SSA rules, and only enabled SSA rules
     rules = [r for r in rules if not r.get("name", "").startswith("SSA ") or r.get("name", "") in enabled_ssas]
 
-    def _compile_list(lst): return [re.compile(p) for p in lst]
+    def _compile_list(lst): return [_compile_cue(p) for p in lst]
 
     for r in rules:
         for k in ("require_any","helpful_cues","forbid_any"):
@@ -1159,10 +2014,12 @@ def load_rules(path=RULES_PATH):
                 if k in r["end"] and isinstance(r["end"][k], list):
                     r["end"][k] = _compile_list(r["end"][k])
         _attach_region_hints(r)
+        _attach_fused_cues(r)
 
     rules.sort(key=lambda x: x.get("priority",0), reverse=True)
     for idx, r in enumerate(rules):
         r["_cache_id"] = idx
+        _assign_hit_slots(r)
     return rules
 
 def _hits(text, patterns): 
@@ -1920,7 +2777,7 @@ class PreviewFlow:
     def _render_page_image(self, page_index):
         page = self._doc[page_index]
         pix = page.get_pixmap(matrix=fitz.Matrix(self.base_zoom, self.base_zoom), alpha=False)
-        img = Image.open(io.BytesIO(pix.tobytes("png")))
+        img = _pixmap_to_image(pix)
         cw, ch = max(1, self.top.winfo_width()-40), max(1, self.top.winfo_height()-170)
         max_w, max_h = int(cw * self.view_scale), int(ch * self.view_scale)
         w, h = img.size
@@ -2075,6 +2932,7 @@ def apply_rules_collect(pdf_path, rules, session_paths, pump=None, progress_call
     suspect_max = None if _ALLOW_OCR else 12
     _opportunistic_ocr_suspects(max_pages=suspect_max, force_full=_ALLOW_OCR)
     cleaned = [_page_cleaned(pdf_path, i) for i in range(n)]
+    _precompute_hits_parallel(rules, cleaned)
     if progress_callback:
         progress_callback(10)  # Initial text extraction done
     taken = set()
@@ -2393,7 +3251,9 @@ def process_pdf(path, status_lbl, progress, parent_window=None):
         _start_progress(progress, 10)
         begin_text_session(path, allow_ocr=True)
         try:
-            for i in _suspect_pages():
+            suspects = _suspect_pages()
+            _ocr_thin_pages_parallel(suspects)
+            for i in suspects:
                 _ = _page_cleaned(path, i)
             auto_saved, prompt_items, lines, match_stats = apply_rules_collect(
                 path, rules, session_paths,
@@ -2412,7 +3272,9 @@ def process_pdf(path, status_lbl, progress, parent_window=None):
         begin_text_session(path, allow_ocr=allow_ocr)
         try:
             if allow_ocr:
-                for i in _suspect_pages():
+                suspects = _suspect_pages()
+                _ocr_thin_pages_parallel(suspects)
+                for i in suspects:
                     if _CANCELLED:
                         break
                     _ = _page_cleaned(path, i)
@@ -2430,7 +3292,9 @@ def process_pdf(path, status_lbl, progress, parent_window=None):
             _start_progress(progress, 10)
             begin_text_session(path, allow_ocr=True)
             try:
-                for i in _suspect_pages():
+                suspects = _suspect_pages()
+                _ocr_thin_pages_parallel(suspects)
+                for i in suspects:
                     _ = _page_cleaned(path, i)
                 auto_saved, prompt_items, lines, match_stats = apply_rules_collect(
                 path, rules, session_paths,
@@ -0,0 +1,34 @@
+import os
+import tempfile
+import unittest
+
+import fitz
+
+from Tabs import MvrRunner
+
+
+class ParseMultiPageMvrTests(unittest.TestCase):
+    def _write_pdf(self, pages):
+        fd, path = tempfile.mkstemp(suffix=".pdf")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        doc = fitz.open()
+        for text in pages:
+            doc.new_page().insert_text((72, 72), text)
+        doc.save(path)
+        doc.close()
+        return path
+
+    def test_labelled_dob_on_page_two_beats_report_date_on_page_one(self):
+        path = self._write_pdf([
+            "Report Date: 01/02/2024",
+            "Name: SMITH, JOHN\nDOB: 05/06/1980",
+        ])
+        parsed = MvrRunner._parse_mvr_fields(MvrRunner._extract_text_from_pdf(path))
+        self.assertEqual(parsed["dob"], "05/06/1980")
+        self.assertEqual(parsed["last_name"], "SMITH")
+        self.assertEqual(parsed["first_name"], "JOHN")
+
+
+if __name__ == "__main__":
+    unittest.main()